@@ -101,16 +101,24 @@ try:
         """Run migrations using a synchronous engine.
 
         This function creates a standard SQLAlchemy engine for database connections.
+        A single pooled connection is kept so repeated checkouts reuse the same
+        session instead of reconnecting to the remote database.
         """
         connectable = engine_from_config(
             config.get_section(config.config_ini_section),
             prefix="sqlalchemy.",
-            poolclass=pool.NullPool,
+            poolclass=pool.QueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_pre_ping=True,
             future=True,
         )
 
-        with connectable.connect() as connection:
-            do_run_migrations(connection)
+        try:
+            with connectable.connect() as connection:
+                do_run_migrations(connection)
+        finally:
+            connectable.dispose()
 
     if context.is_offline_mode():
         run_migrations_offline()
@@ -0,0 +1,32 @@
+"""Add server default timestamps
+
+Revision ID: e7a4b2f1c906
+Revises: c3d91f6a2e58
+Create Date: 2026-10-15 13:22:40.118562
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a4b2f1c906'
+down_revision = 'c3d91f6a2e58'
+branch_labels = None
+depends_on = None
+
+TABLES = ('users', 'locations', 'temperature_records', 'uv_records', 'skin_cancer_data')
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+UTC_NOW = sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        for column in TIMESTAMP_COLUMNS:
+            op.alter_column(table, column, server_default=UTC_NOW)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        for column in TIMESTAMP_COLUMNS:
+            op.alter_column(table, column, server_default=None)
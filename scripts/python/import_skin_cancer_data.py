@@ -3,18 +3,25 @@
 Script to import skin cancer data from CSV into the database.
 
 This script will:
-1. Drop all existing data from the skin_cancer_data table
-2. Import data from the CSV file into the table
+1. Load the CSV into a regular skin_cancer_data_new staging table using
+   PostgreSQL COPY, then build its primary key and indexes
+2. Swap the staging table in for skin_cancer_data, dropping all existing data,
+   in the same transaction as the load
 3. Work in any environment (local, dev, prod)
 
 Usage:
     python -m scripts.python.import_skin_cancer_data
 """
 import csv
+import io
 import os
 import sys
+import uuid
+from datetime import datetime
 from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
 
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.app.core.config import settings
@@ -28,6 +35,175 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 # Configure logging
 logger = get_logger(__name__)
 
+# Path to the CSV file
+CSV_PATH = (
+    Path(__file__).resolve().parent.parent.parent
+    / "src"
+    / "app"
+    / "data"
+    / "skin_cancer_data.csv"
+)
+
+# Source columns that must be present and non-empty for a row to be imported
+REQUIRED_COLUMNS = (
+    "Data type",
+    "Cancer group/site",
+    "Year",
+    "Sex",
+    "Age group (years)",
+    "Count",
+)
+
+# Cleaned row: (data_type, cancer_group, year, sex, age_group, count)
+Record = Tuple[str, str, int, str, str, int]
+
+# Columns loaded by COPY, in the order the cleaned CSV lines are written
+COPY_COLUMNS = (
+    "id",
+    "data_type",
+    "cancer_group",
+    "year",
+    "sex",
+    "age_group",
+    "count",
+    "created_at",
+    "updated_at",
+)
+
+# The reload fills a staging table and swaps it in for the live one
+TABLE_NAME = SkinCancerData.__tablename__
+STAGING_TABLE_NAME = f"{TABLE_NAME}_new"
+COPY_SQL = (
+    f"COPY {STAGING_TABLE_NAME} ({', '.join(COPY_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT CSV)"
+)
+
+# Secondary indexes built on the staging table once the data is loaded
+SKIN_CANCER_INDEXES = tuple(SkinCancerData.__table__.indexes)
+
+
+class CopyStream(io.TextIOBase):
+    """Read-only text stream over an iterator of CSV lines.
+
+    This lets ``COPY ... FROM STDIN`` pull rows on demand instead of
+    materializing the whole payload in memory.
+    """
+
+    def __init__(self, lines: Iterator[str]) -> None:
+        """Initialize CopyStream.
+
+        Args:
+            lines: Iterator of CSV-formatted lines.
+        """
+        self._lines = lines
+        self._buffer = ""
+        self.lines_read = 0
+
+    def readable(self) -> bool:
+        """Report that the stream supports reading."""
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        """Read up to ``size`` characters from the stream.
+
+        Args:
+            size: Maximum number of characters to return, or -1 for all.
+
+        Returns:
+            The next chunk of CSV text, or an empty string when exhausted.
+        """
+        if size is None or size < 0:
+            lines = list(self._lines)
+            self.lines_read += len(lines)
+            chunk = self._buffer + "".join(lines)
+            self._buffer = ""
+            return chunk
+
+        while len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self.lines_read += 1
+            self._buffer += line
+
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def iter_records(reader: Iterator[List[str]]) -> Iterator[Record]:
+    """Yield cleaned skin cancer records from the CSV reader.
+
+    The header row is read once to resolve the position of each required
+    column, so data rows can be indexed directly instead of building a dict
+    per row.
+
+    Args:
+        reader: ``csv.reader`` over the source file, positioned at the header.
+
+    Yields:
+        (data_type, cancer_group, year, sex, age_group, count) tuples for each
+        valid source row.
+
+    Raises:
+        ValueError: If a required column is missing from the header.
+    """
+    header = next(reader, [])
+    missing = [column for column in REQUIRED_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"CSV file is missing required columns: {missing}")
+
+    indices = tuple(header.index(column) for column in REQUIRED_COLUMNS)
+    i_data_type, i_cancer_group, i_year, i_sex, i_age_group, i_count = indices
+    width = max(indices) + 1
+
+    for row in reader:
+        # Skip rows with missing required data
+        if len(row) < width or not all(row[i] for i in indices):
+            logger.warning(f"Skipping row with missing data: {row}")
+            continue
+
+        # Handle the case where Count might be 'np' (not provided) or other non-numeric values
+        count_value = row[i_count]
+        if not count_value.isdigit():
+            logger.warning(f"Skipping row with non-numeric count: {row}")
+            continue
+
+        try:
+            count = int(count_value)
+            year = int(row[i_year])
+        except ValueError as e:
+            logger.error(f"Error processing row {row}: {str(e)}")
+            continue
+
+        yield (
+            row[i_data_type],
+            row[i_cancer_group],
+            year,
+            row[i_sex],
+            row[i_age_group].replace("'", ""),
+            count,
+        )
+
+
+def iter_copy_lines(records: Iterable[Record]) -> Iterator[str]:
+    """Encode records as CSV lines matching COPY_COLUMNS.
+
+    Args:
+        records: Cleaned skin cancer records.
+
+    Yields:
+        One CSV-formatted line per record.
+    """
+    timestamp = datetime.utcnow().isoformat()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    for record in records:
+        writer.writerow((str(uuid.uuid4()), *record, timestamp, timestamp))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
 
 def import_skin_cancer_data():
     """Import skin cancer data from CSV into the database."""
@@ -42,102 +218,75 @@ def import_skin_cancer_data():
         logger.error("Failed to initialize database connection")
         sys.exit(1)
 
-    # Path to the CSV file
-    csv_path = (
-        Path(__file__).resolve().parent.parent.parent
-        / "src"
-        / "app"
-        / "data"
-        / "skin_cancer_data.csv"
-    )
-
-    if not csv_path.exists():
-        logger.error(f"CSV file not found at {csv_path}")
+    if not CSV_PATH.exists():
+        logger.error(f"CSV file not found at {CSV_PATH}")
         sys.exit(1)
 
-    logger.info(f"Importing skin cancer data from {csv_path}")
+    logger.info(f"Importing skin cancer data from {CSV_PATH}")
 
     try:
-        with db_manager.session() as session:
-            # Delete existing data
-            logger.info("Deleting existing skin cancer data...")
-            session.query(SkinCancerData).delete()
-            session.commit()
-            logger.info("Existing data deleted successfully")
-
-            # Read and import data from CSV
+        # Load into a staging table and swap it in at the end of the same
+        # transaction: readers keep seeing the old data until the commit, and a
+        # failed import leaves it intact
+        with db_manager.session() as session, session.begin():
+            connection = session.connection()
+
+            # Create the staging table in the loading transaction; with
+            # wal_level=minimal PostgreSQL can then skip WAL for the COPY
+            session.execute(text(f"DROP TABLE IF EXISTS {STAGING_TABLE_NAME}"))
+            session.execute(
+                text(
+                    f"CREATE TABLE {STAGING_TABLE_NAME} "
+                    f"(LIKE {TABLE_NAME} INCLUDING DEFAULTS)"
+                )
+            )
+
+            # Stream the cleaned CSV straight into the staging table with COPY
             logger.info("Importing new data from CSV...")
-            records_imported = 0
-
-            with open(csv_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-
-                # Process in batches for better performance
-                batch_size = 1000
-                batch = []
-
-                for row in reader:
-                    # Skip rows with missing required data
-                    if not all(
-                        key in row and row[key]
-                        for key in [
-                            "Data type",
-                            "Cancer group/site",
-                            "Year",
-                            "Sex",
-                            "Age group (years)",
-                            "Count",
-                        ]
-                    ):
-                        logger.warning(f"Skipping row with missing data: {row}")
-                        continue
-
-                    # Clean and convert data
-                    try:
-                        # Handle the case where Count might be 'np' (not provided) or other non-numeric values
-                        count_value = row["Count"]
-                        if count_value.isdigit():
-                            count = int(count_value)
-                        else:
-                            logger.warning(
-                                f"Skipping row with non-numeric count: {row}"
-                            )
-                            continue
-
-                        cleaned_age_group = row["Age group (years)"].replace("'", "")
-
-                        # Create a new record
-                        record = SkinCancerData(
-                            data_type=row["Data type"],
-                            cancer_group=row["Cancer group/site"],
-                            year=int(row["Year"]),
-                            sex=row["Sex"],
-                            age_group=cleaned_age_group,
-                            count=count,
-                        )
-
-                        batch.append(record)
-                        records_imported += 1
-
-                        # Insert batch when it reaches the batch size
-                        if len(batch) >= batch_size:
-                            session.add_all(batch)
-                            session.commit()
-                            logger.info(
-                                f"Imported {records_imported} records so far..."
-                            )
-                            batch = []
-
-                    except (ValueError, KeyError) as e:
-                        logger.error(f"Error processing row {row}: {str(e)}")
-                        continue
-
-                # Insert any remaining records
-                if batch:
-                    session.add_all(batch)
-                    session.commit()
-
-            logger.info(f"Successfully imported {records_imported} records")
+            with open(CSV_PATH, "r", encoding="utf-8") as csvfile:
+                reader = csv.reader(csvfile)
+                stream = CopyStream(iter_copy_lines(iter_records(reader)))
+
+                with connection.connection.cursor() as cursor:
+                    cursor.copy_expert(COPY_SQL, stream)
+
+            # Build the primary key and indexes in bulk over the loaded data
+            logger.info("Building skin cancer data indexes...")
+            session.execute(
+                text(
+                    f"ALTER TABLE {STAGING_TABLE_NAME} "
+                    f"ADD CONSTRAINT {STAGING_TABLE_NAME}_pkey PRIMARY KEY (id)"
+                )
+            )
+            for index in SKIN_CANCER_INDEXES:
+                columns = ", ".join(column.name for column in index.columns)
+                include = index.dialect_options["postgresql"]["include"]
+                include_clause = f" INCLUDE ({', '.join(include)})" if include else ""
+                session.execute(
+                    text(
+                        f"CREATE INDEX {index.name}_new "
+                        f"ON {STAGING_TABLE_NAME} ({columns}){include_clause}"
+                    )
+                )
+
+            # Swap the tables, restoring the names the model expects
+            logger.info("Replacing existing skin cancer data...")
+            session.execute(text(f"DROP TABLE {TABLE_NAME}"))
+            session.execute(
+                text(f"ALTER TABLE {STAGING_TABLE_NAME} RENAME TO {TABLE_NAME}")
+            )
+            session.execute(
+                text(
+                    f"ALTER TABLE {TABLE_NAME} RENAME CONSTRAINT "
+                    f"{STAGING_TABLE_NAME}_pkey TO {TABLE_NAME}_pkey"
+                )
+            )
+            for index in SKIN_CANCER_INDEXES:
+                session.execute(
+                    text(f"ALTER INDEX {index.name}_new RENAME TO {index.name}")
+                )
+
+        logger.info(f"Successfully imported {stream.lines_read} records")
 
     except SQLAlchemyError as e:
         logger.error(f"Database error: {str(e)}")
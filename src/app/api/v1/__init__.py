@@ -9,12 +9,8 @@ from src.app.api.v1.weather import router as weather_router
 
 api_router = APIRouter()
 
-# Include all routers
-api_router.include_router(health_router, prefix="/health", tags=["health"])
-api_router.include_router(
-    google_maps_router, prefix="/google-maps", tags=["google-maps"]
-)
-api_router.include_router(
-    skin_cancer_router, prefix="/skin-cancer", tags=["skin-cancer"]
-)
-api_router.include_router(weather_router, prefix="/weather", tags=["weather"])
+# Include all routers (each router declares its own tags)
+api_router.include_router(health_router, prefix="/health")
+api_router.include_router(google_maps_router, prefix="/google-maps")
+api_router.include_router(skin_cancer_router, prefix="/skin-cancer")
+api_router.include_router(weather_router, prefix="/weather")
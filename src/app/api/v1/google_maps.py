@@ -40,18 +40,18 @@ async def get_address_predictions(
         HTTPException: If there's an error fetching address predictions.
     """
     try:
-        logger.info(f"Getting address predictions for input: {request.input}")
+        logger.info("Getting address predictions for input: %s", request.input)
         predictions = await google_maps_service.get_address_predictions(request.input)
         return AddressPredictionResponse(predictions=predictions)
 
     except ValueError as e:
-        logger.error(f"Invalid request: {e}")
+        logger.error("Invalid request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except Exception as e:
-        logger.error(f"Error getting address predictions: {e}")
+        logger.error("Error getting address predictions: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error fetching address predictions",
@@ -78,18 +78,18 @@ async def get_place_details(request: PlaceDetailsRequest) -> PlaceDetails:
         HTTPException: If there's an error fetching place details.
     """
     try:
-        logger.info(f"Getting place details for place_id: {request.place_id}")
+        logger.info("Getting place details for place_id: %s", request.place_id)
         place_details = await google_maps_service.get_place_details(request.place_id)
         return PlaceDetails(**place_details)
 
     except ValueError as e:
-        logger.error(f"Invalid request: {e}")
+        logger.error("Invalid request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except Exception as e:
-        logger.error(f"Error getting place details: {e}")
+        logger.error("Error getting place details: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error fetching place details",
@@ -116,18 +116,18 @@ async def geocode_address(request: GeocodeRequest) -> GeocodeResponse:
         HTTPException: If there's an error geocoding the address.
     """
     try:
-        logger.info(f"Geocoding address: {request.address}")
+        logger.info("Geocoding address: %s", request.address)
         geocode_result = await google_maps_service.geocode_address(request.address)
         return GeocodeResponse(**geocode_result)
 
     except ValueError as e:
-        logger.error(f"Invalid request: {e}")
+        logger.error("Invalid request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except Exception as e:
-        logger.error(f"Error geocoding address: {e}")
+        logger.error("Error geocoding address: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error geocoding address",
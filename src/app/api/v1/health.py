@@ -1,12 +1,15 @@
 """Health check endpoints."""
 
+import json
 import logging
 import platform
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from src.app.core.config import settings
@@ -16,45 +19,72 @@ from src.app.schemas.health import HealthResponse
 router = APIRouter(tags=["health"])
 logger = logging.getLogger(__name__)
 
+# Statement used to check database connectivity, built once at import
+_PING_STMT = text("SELECT 1")
+
+# Static application details, read from settings once at import
+APP_VERSION = settings.APP_VERSION
+ENVIRONMENT = settings.ENVIRONMENT
+
+# /ping body up to the timestamp value, so each request only appends the time
+_PING_PREFIX = (
+    json.dumps(
+        {"status": "healthy", "version": APP_VERSION, "environment": ENVIRONMENT},
+        separators=(",", ":"),
+    )[:-1]
+    + ',"timestamp":"'
+).encode()
+
 
 @router.get(
     "/",
     response_model=HealthResponse,
     status_code=status.HTTP_200_OK,
     summary="Health check",
-    description="Check the health of the application and its dependencies.",
+    description=(
+        "Check the health of the application and its dependencies. Responds "
+        "with 503 if the database cannot be connected to."
+    ),
+    responses={
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Database is unavailable"}
+    },
 )
 def health_check(db: Session = Depends(get_db)) -> HealthResponse:
     """Check the health of the application and its dependencies.
 
+    The database session comes from ``get_db``, which fails the request with
+    503 before this runs if the database cannot be connected to. The
+    dependency report only marks the database unhealthy when a query on an
+    open connection fails.
+
     Args:
         db: Database session.
 
     Returns:
         Health status information.
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
 
     # Check database connection
     db_status = "healthy"
     db_message = "Connected successfully"
     try:
         # Execute a simple query to check database connection
-        db.execute(text("SELECT 1"))
+        db.execute(_PING_STMT)
         logger.info("Database health check passed")
-    except Exception as e:
+    except SQLAlchemyError as e:
         db_status = "unhealthy"
         db_message = str(e)
-        logger.warning(f"Database health check failed: {e}")
+        logger.warning("Database health check failed: %s", e)
 
     # Calculate response time
-    response_time = (datetime.now() - start_time).total_seconds()
+    response_time = time.perf_counter() - start_time
 
     return HealthResponse(
         status="healthy",
-        version=settings.APP_VERSION,
-        environment=settings.ENVIRONMENT,
-        timestamp=datetime.now().isoformat(),
+        version=APP_VERSION,
+        environment=ENVIRONMENT,
+        timestamp=datetime.now(timezone.utc).isoformat(),
         uptime=response_time,
         dependencies={
             "database": {
@@ -74,16 +104,15 @@ def health_check(db: Session = Depends(get_db)) -> HealthResponse:
     status_code=status.HTTP_200_OK,
     summary="Simple health check",
     description="Simple health check that doesn't require a database connection.",
+    response_class=Response,
 )
-def ping() -> dict:
+def ping() -> Response:
     """Simple health check that doesn't require a database connection.
 
     Returns:
-        Basic health status information.
+        Basic health status information as JSON.
     """
-    return {
-        "status": "healthy",
-        "version": settings.APP_VERSION,
-        "environment": settings.ENVIRONMENT,
-        "timestamp": datetime.now().isoformat(),
-    }
+    timestamp = datetime.now(timezone.utc).isoformat().encode()
+    return Response(
+        content=_PING_PREFIX + timestamp + b'"}', media_type="application/json"
+    )
@@ -3,15 +3,17 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from src.app.api.dependencies import get_db
+from src.app.core.responses import orjson_response
 from src.app.crud.crud_skin_cancer import skin_cancer_crud
 from src.app.schemas.skin_cancer import (
     AgeGroupEnum,
     DataTypeEnum,
     SexEnum,
+    SkinCancerData,
     SkinCancerDataResponse,
     SkinCancerFilter,
 )
@@ -19,6 +21,12 @@ from src.app.schemas.skin_cancer import (
 router = APIRouter(tags=["skin-cancer"])
 logger = logging.getLogger(__name__)
 
+# Fields of each returned record, in response order
+SKIN_CANCER_FIELDS = tuple(SkinCancerData.model_fields)
+
+# The data only changes on manual re-imports
+SKIN_CANCER_CACHE_CONTROL = "public, max-age=300"
+
 
 @router.get(
     "/",
@@ -27,7 +35,7 @@ logger = logging.getLogger(__name__)
     summary="Get skin cancer data",
     description="Get skin cancer data with optional filtering.",
 )
-async def get_skin_cancer_data(
+def get_skin_cancer_data(
     data_type: Optional[DataTypeEnum] = None,
     year: Optional[int] = None,
     sex: Optional[SexEnum] = None,
@@ -37,9 +45,13 @@ async def get_skin_cancer_data(
         100, ge=1, le=5000, description="Maximum number of records to return"
     ),
     db: Session = Depends(get_db),
-) -> SkinCancerDataResponse:
+) -> Response:
     """Get skin cancer data with optional filtering.
 
+    Declared as a plain function so FastAPI runs the blocking database queries
+    in its threadpool instead of on the event loop. Records are serialized
+    directly rather than validated against the response model one by one.
+
     Args:
         data_type: Type of data (Actual or Projections)
         year: Year of the data
@@ -66,20 +78,24 @@ async def get_skin_cancer_data(
             age_group=age_group,
         )
 
-        # Set cancer_group filter to "Melanoma of the skin"
-        filters_dict = filters.model_dump(exclude_none=True)
-        filters_dict["cancer_group"] = "Melanoma of the skin"
-
-        # Get filtered data
-        data = skin_cancer_crud.get_filtered(
+        # Get filtered data (the CRUD layer restricts to "Melanoma of the skin")
+        data, total = skin_cancer_crud.get_filtered_with_total(
             db, filters=filters, skip=skip, limit=limit
         )
-        total = skin_cancer_crud.count_filtered(db, filters=filters)
 
-        return SkinCancerDataResponse(data=data, total=total)
+        return orjson_response(
+            {
+                "data": [
+                    {field: getattr(row, field, None) for field in SKIN_CANCER_FIELDS}
+                    for row in data
+                ],
+                "total": total,
+            },
+            headers={"Cache-Control": SKIN_CANCER_CACHE_CONTROL},
+        )
 
     except Exception as e:
-        logger.error(f"Error getting skin cancer data: {e}")
+        logger.error("Error getting skin cancer data: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error fetching skin cancer data",
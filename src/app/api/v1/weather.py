@@ -1,20 +1,44 @@
 """Weather API endpoints."""
 
+import asyncio
+import functools
+import hashlib
+import itertools
 import logging
+import time
 import urllib.parse
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple, get_args
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from fastapi.responses import StreamingResponse
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.orm import Session
 
 from src.app.api.dependencies import get_db
+from src.app.core.config import settings
+from src.app.core.db.session import db_manager
+from src.app.core.http_client import http_client_manager
+from src.app.core.responses import orjson_response
+from src.app.core.utils import SingleFlight, TTLCache
 from src.app.crud.crud_locations import location_crud
 from src.app.crud.crud_temperature_records import temperature_record_crud
 from src.app.crud.crud_users import user_crud
 from src.app.crud.crud_uv_records import uv_record_crud
 from src.app.schemas.weather import (
+    MapPeriod,
+    Region,
     TemperatureMapResponse,
+    TemperatureType,
     UVIndexHeatmapResponse,
     WeatherRequest,
     WeatherResponse,
@@ -24,6 +48,322 @@ from src.app.services.weather import weather_service
 router = APIRouter(tags=["weather"])
 logger = logging.getLogger(__name__)
 
+# Display names for the map query parameters
+PERIOD_DISPLAY: Mapping[str, str] = MappingProxyType(
+    {
+        "annual": "Annual",
+        "jan": "January",
+        "feb": "February",
+        "mar": "March",
+        "apr": "April",
+        "may": "May",
+        "jun": "June",
+        "jul": "July",
+        "aug": "August",
+        "sep": "September",
+        "oct": "October",
+        "nov": "November",
+        "dec": "December",
+    }
+)
+TEMP_TYPE_DISPLAY: Mapping[str, str] = MappingProxyType(
+    {
+        "mean": "Mean Temperature",
+        "max": "Maximum Temperature",
+        "min": "Minimum Temperature",
+    }
+)
+REGION_DISPLAY: Mapping[str, str] = MappingProxyType(
+    {
+        "aus": "Australia",
+        "ns": "New South Wales",
+        "nt": "Northern Territory",
+        "qd": "Queensland",
+        "sa": "South Australia",
+        "ta": "Tasmania",
+        "vc": "Victoria",
+        "wa": "Western Australia",
+    }
+)
+
+# Weather responses may be cached by browsers and proxies for 10 minutes
+WEATHER_CACHE_CONTROL = "public, max-age=600"
+
+# Image proxy route and the only hosts it will fetch from
+PROXY_IMAGE_PATH = "/api/v1/weather/proxy-image"
+ALLOWED_IMAGE_HOSTS = frozenset({"www.bom.gov.au", "reg.bom.gov.au"})
+# Redirects are followed by hand so every hop is checked against the hosts
+MAX_IMAGE_REDIRECTS = 3
+
+# Bounds in-flight upstream image fetches
+proxy_image_slots = asyncio.Semaphore(settings.PROXY_IMAGE_CONCURRENCY)
+
+# Proxied BoM maps change at most daily: cached copies are served for 6 hours,
+# then revalidated with the upstream ETag/Last-Modified
+IMAGE_CACHE_MAXSIZE = 128
+IMAGE_CACHE_FRESH_SECONDS = 6 * 3600
+IMAGE_CACHE_TTL = 24 * 3600
+
+
+class CachedImage(NamedTuple):
+    """Proxied image body with the validators needed to revalidate it."""
+
+    content: bytes
+    media_type: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh_until: float
+
+
+image_cache: TTLCache[str, CachedImage] = TTLCache(
+    maxsize=IMAGE_CACHE_MAXSIZE, ttl=IMAGE_CACHE_TTL
+)
+image_fetches: SingleFlight[str, CachedImage] = SingleFlight()
+
+
+def _proxied_image_url(url: str) -> str:
+    """Get the URL of this API's image proxy for an upstream image.
+
+    Args:
+        url: The URL of the upstream image.
+
+    Returns:
+        Proxy URL carrying the percent-encoded upstream URL.
+    """
+    return f"{PROXY_IMAGE_PATH}?url={urllib.parse.quote(url, safe='')}"
+
+
+# BoM map responses only depend on the query parameters, of which there are a
+# few hundred combinations, so their JSON bodies are all built once at import
+UV_HEATMAP_BODIES: Mapping[str, bytes] = MappingProxyType(
+    {
+        period: UVIndexHeatmapResponse(
+            url=_proxied_image_url(weather_service.get_uv_index_heatmap_url(period)),
+            period=PERIOD_DISPLAY[period],
+        )
+        .model_dump_json()
+        .encode()
+        for period in get_args(MapPeriod)
+    }
+)
+TEMPERATURE_MAP_BODIES: Mapping[Tuple[str, str, str], bytes] = MappingProxyType(
+    {
+        (temp_type, region, period): TemperatureMapResponse(
+            url=_proxied_image_url(
+                weather_service.get_temperature_map_url(temp_type, region, period)
+            ),
+            temp_type=TEMP_TYPE_DISPLAY[temp_type],
+            region=REGION_DISPLAY[region],
+            period=PERIOD_DISPLAY[period],
+        )
+        .model_dump_json()
+        .encode()
+        for temp_type, region, period in itertools.product(
+            get_args(TemperatureType), get_args(Region), get_args(MapPeriod)
+        )
+    }
+)
+
+
+async def _fetch_cached_image(
+    url: str, headers: Dict[str, str], cached: Optional[CachedImage]
+) -> CachedImage:
+    """Fetch an image into the image cache, revalidating a stale copy.
+
+    Args:
+        url: The URL of the image.
+        headers: Request headers to send upstream.
+        cached: Stale cached copy of the image, if any.
+
+    Returns:
+        The fresh cached image.
+
+    Raises:
+        HTTPException: If the source does not return the image, or redirects
+            to a URL that may not be proxied.
+    """
+    headers = dict(headers)
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    async with proxy_image_slots:
+        fetch_url = url
+        for _ in range(MAX_IMAGE_REDIRECTS + 1):
+            response = await http_client_manager.client.get(
+                fetch_url, headers=headers, follow_redirects=False
+            )
+            if not response.has_redirect_location:
+                break
+            fetch_url = _resolve_redirect_url(response)
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail="Too many redirects from the image source",
+            )
+    fresh_until = time.monotonic() + IMAGE_CACHE_FRESH_SECONDS
+
+    if cached is not None and response.status_code == 304:
+        image = cached._replace(fresh_until=fresh_until)
+    elif response.status_code == 200:
+        image = CachedImage(
+            content=response.content,
+            media_type=response.headers.get("content-type", "image/png"),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            fresh_until=fresh_until,
+        )
+    else:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail="Failed to retrieve the image from the source",
+        )
+
+    image_cache.set(url, image)
+    return image
+
+
+def _resolve_redirect_url(response: httpx.Response) -> str:
+    """Get the target of an upstream redirect, checking that it may be proxied.
+
+    Args:
+        response: Redirect response from the image source.
+
+    Returns:
+        The absolute redirect target URL.
+
+    Raises:
+        HTTPException: If the redirect points at a host that is not allowed.
+    """
+    target = urllib.parse.urljoin(str(response.url), response.headers["location"])
+    try:
+        return _resolve_image_url(target)
+    except HTTPException:
+        logger.warning("Refusing image redirect to: %s", target)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Image source redirected to a URL that is not allowed",
+        )
+
+
+def _resolve_image_url(url: str) -> str:
+    """Normalize an image URL and check that it may be proxied.
+
+    Args:
+        url: The URL of the image, with or without a scheme.
+
+    Returns:
+        The absolute image URL.
+
+    Raises:
+        HTTPException: If the URL does not point at an allowed host.
+    """
+    parts = urllib.parse.urlsplit(url)
+    if not parts.scheme:
+        parts = urllib.parse.urlsplit(f"https://{parts.geturl()}")
+
+    if parts.scheme not in ("http", "https") or (
+        parts.hostname not in ALLOWED_IMAGE_HOSTS
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Image URL is not allowed",
+        )
+    return parts.geturl()
+
+
+def _render_weather(weather_data: Dict[str, Any]) -> bytes:
+    """Validate weather data against the response schema and serialize it.
+
+    Routes return the rendered body in a plain ``Response``, so FastAPI does
+    not validate and encode the data a second time.
+
+    Args:
+        weather_data: Weather data from the weather service.
+
+    Returns:
+        JSON-encoded ``WeatherResponse``.
+    """
+    return WeatherResponse.model_validate(weather_data).model_dump_json().encode()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an ``If-None-Match`` header against a response's ETag.
+
+    Uses weak comparison, as required for ``If-None-Match``: the header may be
+    ``*`` or a comma-separated list of strong or ``W/``-prefixed weak tags.
+
+    Args:
+        if_none_match: ``If-None-Match`` request header, if sent.
+        etag: Strong ETag of the current response.
+
+    Returns:
+        True if the client's cached copy is still current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def _persist_weather(request: WeatherRequest, weather_data: Dict[str, Any]) -> None:
+    """Save the user, location and weather records for a weather request.
+
+    Runs as a background task after the response has been sent, so it uses its
+    own database session rather than the request-scoped one. All writes are
+    committed together in a single transaction.
+
+    Args:
+        request: Weather request containing coordinates and user name.
+        weather_data: Weather data returned to the client.
+    """
+    try:
+        with db_manager.session() as db:
+            # Get or create user
+            user = user_crud.get_or_create(db, name=request.name, commit=False)
+            logger.debug("User found/created: %s - %s", user.id, user.name)
+
+            # Get or create location
+            location_info = weather_data["location"]
+            location = location_crud.get_or_create_with_user(
+                db,
+                obj_in={
+                    "lat": request.lat,
+                    "lon": request.lon,
+                    "city": location_info.get("city"),
+                    "country": location_info.get("country"),
+                },
+                user_id=user.id,
+                commit=False,
+            )
+            logger.debug("Location found/created: %s", location.id)
+
+            # Create temperature and UV records, written with the final commit
+            temperature_record = temperature_record_crud.build_from_weather_data(
+                weather_data=weather_data, location_id=location.id
+            )
+            uv_record = uv_record_crud.build_from_weather_data(
+                weather_data=weather_data, location_id=location.id
+            )
+            db.add_all([temperature_record, uv_record])
+
+            db.commit()
+            logger.debug("Created temperature record: %s", temperature_record.id)
+            logger.debug("Created UV record: %s", uv_record.id)
+
+    except Exception as e:
+        # The response has already been sent; failed writes are only logged
+        logger.error("Error saving data to database: %s", e)
+
 
 @router.post(
     "/",
@@ -33,13 +373,15 @@ logger = logging.getLogger(__name__)
     description="Get weather data for a location by coordinates and save to database.",
 )
 async def get_weather(
-    request: WeatherRequest, db: Session = Depends(get_db)
-) -> WeatherResponse:
+    request: WeatherRequest, background_tasks: BackgroundTasks
+) -> Response:
     """Get weather data for a location by coordinates and save to database.
 
+    The database writes run as a background task once the response is sent.
+
     Args:
         request: Weather request containing coordinates and user name.
-        db: Database session.
+        background_tasks: Tasks to run after the response is sent.
 
     Returns:
         Weather data for the requested location.
@@ -49,72 +391,92 @@ async def get_weather(
     """
     try:
         logger.info(
-            f"Getting weather data for coordinates: {request.lat}, {request.lon} for user: {request.name}"
+            "Getting weather data for coordinates: %s, %s for user: %s",
+            request.lat,
+            request.lon,
+            request.name,
         )
 
         # Get weather data
         weather_data = await weather_service.get_weather_data(request.lat, request.lon)
 
-        # Save data to database
-        try:
-            # Get or create user
-            user = user_crud.get_or_create(db, name=request.name)
-            logger.info(f"User found/created: {user.id} - {user.name}")
+        body = _render_weather(weather_data)
 
-            # Create or get location
-            location_info = weather_data["location"]
-            existing_location = location_crud.get_by_coordinates(
-                db, latitude=request.lat, longitude=request.lon
-            )
+        # Save data to database after the response has been sent
+        background_tasks.add_task(_persist_weather, request, weather_data)
 
-            if existing_location:
-                location = existing_location
-                logger.info(f"Using existing location: {location.id}")
-            else:
-                location = location_crud.create_with_user(
-                    db,
-                    obj_in={
-                        "lat": request.lat,
-                        "lon": request.lon,
-                        "city": location_info.get("city"),
-                        "country": location_info.get("country"),
-                    },
-                    user_id=user.id,
-                )
-                logger.info(f"Created new location: {location.id}")
-
-            # Create temperature record
-            temperature_record = temperature_record_crud.create_from_weather_data(
-                db, weather_data=weather_data, location_id=location.id
-            )
-            logger.info(f"Created temperature record: {temperature_record.id}")
+        return Response(content=body, media_type="application/json")
 
-            # Create UV record
-            uv_record = uv_record_crud.create_from_weather_data(
-                db, weather_data=weather_data, location_id=location.id
-            )
-            logger.info(f"Created UV record: {uv_record.id}")
+    except ValueError as e:
+        logger.error("Invalid request: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error("Error getting weather data: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error fetching weather data",
+        )
 
-        except Exception as e:
-            logger.error(f"Error saving data to database: {e}")
-            # Continue with the response even if database operations fail
-            # This ensures the API still returns weather data to the user
 
-        return WeatherResponse(**weather_data)
+@router.get(
+    "/",
+    response_model=WeatherResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get cacheable weather data",
+    description="Get weather data for a location by coordinates without saving it.",
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
+)
+async def read_weather(
+    http_request: Request,
+    lat: float = Query(..., description="Latitude of the location", ge=-90, le=90),
+    lon: float = Query(..., description="Longitude of the location", ge=-180, le=180),
+) -> Response:
+    """Get weather data for a location by coordinates without saving it.
+
+    Unlike the POST endpoint this has no side effects, so the response carries
+    ``Cache-Control`` and ``ETag`` headers for browsers and proxies, and a
+    matching ``If-None-Match`` is answered with 304.
+
+    Args:
+        http_request: Incoming request, used for the ``If-None-Match`` header.
+        lat: Latitude of the location.
+        lon: Longitude of the location.
+
+    Returns:
+        Weather data for the requested location, or an empty 304 response.
+
+    Raises:
+        HTTPException: If there's an error fetching the weather data.
+    """
+    try:
+        logger.info("Reading weather data for coordinates: %s, %s", lat, lon)
+
+        weather_data = await weather_service.get_weather_data(lat, lon)
+        body = _render_weather(weather_data)
 
     except ValueError as e:
-        logger.error(f"Invalid request: {e}")
+        logger.error("Invalid request: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except Exception as e:
-        logger.error(f"Error getting weather data: {e}")
+        logger.error("Error getting weather data: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error fetching weather data",
         )
 
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": WEATHER_CACHE_CONTROL}
+    if _etag_matches(http_request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get(
     "/proxy-image",
@@ -123,10 +485,11 @@ async def get_weather(
 )
 async def proxy_image(
     url: str = Query(..., description="URL of the image to proxy")
-) -> StreamingResponse:
+) -> Response:
     """Proxy for image requests.
 
     Retrieves images from external HTTP sources and serves them via this HTTPS endpoint.
+    Only BoM hosts are proxied, and their images are cached in process.
 
     Args:
         url: The URL of the image to proxy.
@@ -135,21 +498,13 @@ async def proxy_image(
         The image content with appropriate content type.
 
     Raises:
-        HTTPException: If there's an error fetching the image.
+        HTTPException: If the URL is not allowed or there's an error fetching
+            the image.
     """
-    try:
-
-        logger.info(f"Proxying image from: {url}")
-
-        if url.startswith("/api/v1/weather/proxy-image"):
-            nested_url = url.split("url=", 1)[1]
-            url = urllib.parse.unquote(nested_url)
-            logger.info(f"Extracted nested URL: {url}")
-
-        if not url.startswith("http://") and not url.startswith("https://"):
-            url = f"http://{url}"
-            logger.info(f"Added protocol to URL: {url}")
+    logger.info("Proxying image from: %s", url)
+    url = _resolve_image_url(url)
 
+    try:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124",
             "Referer": "http://www.bom.gov.au/",
@@ -158,26 +513,18 @@ async def proxy_image(
             "Cache-Control": "no-cache",
         }
 
-        # Use httpx for async HTTP requests
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
-
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail="Failed to retrieve the image from the source",
-                )
-
-            # Get the content type from the original response
-            content_type = response.headers.get("content-type", "image/png")
-
-            # Return the image content
-            return StreamingResponse(
-                content=iter([response.content]), media_type=content_type
+        image = image_cache.get(url)
+        if image is None or image.fresh_until <= time.monotonic():
+            image = await image_fetches.do(
+                url, functools.partial(_fetch_cached_image, url, headers, image)
             )
+        return Response(content=image.content, media_type=image.media_type)
 
+    except HTTPException:
+        # Upstream error statuses are passed through as they are
+        raise
     except Exception as e:
-        logger.error(f"Error proxying image: {e}")
+        logger.error("Error proxying image: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error proxying image",
@@ -192,11 +539,11 @@ async def proxy_image(
     description="Get URL for UV index heatmap from Australian Bureau of Meteorology.",
 )
 async def get_uv_index_heatmap(
-    period: str = Query(
+    period: MapPeriod = Query(
         "annual",
         description="Time period for the UV index heatmap (annual or month name)",
     )
-) -> UVIndexHeatmapResponse:
+) -> Response:
     """Get URL for UV index heatmap from Australian Bureau of Meteorology.
 
     Args:
@@ -204,66 +551,58 @@ async def get_uv_index_heatmap(
 
     Returns:
         UV index heatmap URL and metadata.
-
-    Raises:
-        HTTPException: If there's an error fetching the UV index heatmap URL.
     """
-    try:
-        logger.info(f"Getting UV index heatmap for period: {period}")
-
-        # Get original UV index heatmap URL
-        original_url = weather_service.get_uv_index_heatmap_url(period)
-
-        # Create proxied URL
-        base_url = "/api/v1/weather/proxy-image"
-        proxied_url = f"{base_url}?url={original_url}"
-
-        # Map period to display name
-        period_display = {
-            "annual": "Annual",
-            "jan": "January",
-            "feb": "February",
-            "mar": "March",
-            "apr": "April",
-            "may": "May",
-            "jun": "June",
-            "jul": "July",
-            "aug": "August",
-            "sep": "September",
-            "oct": "October",
-            "nov": "November",
-            "dec": "December",
-        }
+    logger.info("Getting UV index heatmap for period: %s", period)
 
-        return UVIndexHeatmapResponse(
-            url=proxied_url,
-            period=period_display.get(period, period.capitalize()),
-        )
-
-    except ValueError as e:
-        logger.error(f"Invalid request: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error getting UV index heatmap: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error fetching UV index heatmap",
-        )
+    return Response(content=UV_HEATMAP_BODIES[period], media_type="application/json")
 
 
 @router.get("/temperature-records")
-def read_temperature_records(db: Session = Depends(get_db)):
-    """Getting historical temperature data"""
-    return temperature_record_crud.get_temperature_records(db)
+def read_temperature_records(
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(
+        100, ge=1, le=1000, description="Maximum number of records to return"
+    ),
+    since: Optional[datetime] = Query(
+        None, description="Only return records created after this time"
+    ),
+    after_id: Optional[str] = Query(
+        None,
+        description="With since, also return records created at that time "
+        "with a greater ID",
+    ),
+    db: Session = Depends(get_db),
+):
+    """Getting historical temperature data, one page at a time"""
+    return orjson_response(
+        temperature_record_crud.get_temperature_records(
+            db, skip=skip, limit=limit, since=since, after_id=after_id
+        )
+    )
 
 
 @router.get("/uv-records")
-def read_uv_records(db: Session = Depends(get_db)):
-    """Get all historical UV index records"""
-    return uv_record_crud.get_uv_records(db)
+def read_uv_records(
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(
+        100, ge=1, le=1000, description="Maximum number of records to return"
+    ),
+    since: Optional[datetime] = Query(
+        None, description="Only return records created after this time"
+    ),
+    after_id: Optional[str] = Query(
+        None,
+        description="With since, also return records created at that time "
+        "with a greater ID",
+    ),
+    db: Session = Depends(get_db),
+):
+    """Get historical UV index records, one page at a time"""
+    return orjson_response(
+        uv_record_crud.get_uv_records(
+            db, skip=skip, limit=limit, since=since, after_id=after_id
+        )
+    )
 
 
 @router.get(
@@ -274,17 +613,17 @@ def read_uv_records(db: Session = Depends(get_db)):
     description="Get URL for temperature map from Australian Bureau of Meteorology.",
 )
 async def get_temperature_map(
-    temp_type: str = Query(
+    temp_type: TemperatureType = Query(
         "mean", description="Type of temperature map (mean, max, or min)"
     ),
-    region: str = Query(
+    region: Region = Query(
         "aus", description="Region of Australia (aus, ns, nt, qd, sa, ta, vc, wa)"
     ),
-    period: str = Query(
+    period: MapPeriod = Query(
         "annual",
         description="Time period for the temperature map (annual or month name)",
     ),
-) -> TemperatureMapResponse:
+) -> Response:
     """Get URL for temperature map from Australian Bureau of Meteorology.
 
     Args:
@@ -294,77 +633,15 @@ async def get_temperature_map(
 
     Returns:
         Temperature map URL and metadata.
-
-    Raises:
-        HTTPException: If there's an error fetching the temperature map URL.
     """
-    try:
-        logger.info(
-            f"Getting temperature map for type: {temp_type}, "
-            f"region: {region}, period: {period}"
-        )
-
-        # Get original temperature map URL
-        original_url = weather_service.get_temperature_map_url(
-            temp_type, region, period
-        )
-
-        # Create proxied URL
-        base_url = "/api/v1/weather/proxy-image"
-        proxied_url = f"{base_url}?url={original_url}"
-
-        # Map temperature type to display name
-        temp_type_display = {
-            "mean": "Mean Temperature",
-            "max": "Maximum Temperature",
-            "min": "Minimum Temperature",
-        }
-
-        # Map region to display name
-        region_display = {
-            "aus": "Australia",
-            "ns": "New South Wales",
-            "nt": "Northern Territory",
-            "qd": "Queensland",
-            "sa": "South Australia",
-            "ta": "Tasmania",
-            "vc": "Victoria",
-            "wa": "Western Australia",
-        }
-
-        # Map period to display name
-        period_display = {
-            "annual": "Annual",
-            "jan": "January",
-            "feb": "February",
-            "mar": "March",
-            "apr": "April",
-            "may": "May",
-            "jun": "June",
-            "jul": "July",
-            "aug": "August",
-            "sep": "September",
-            "oct": "October",
-            "nov": "November",
-            "dec": "December",
-        }
-
-        return TemperatureMapResponse(
-            url=proxied_url,
-            temp_type=temp_type_display.get(temp_type, temp_type.capitalize()),
-            region=region_display.get(region, region.upper()),
-            period=period_display.get(period, period.capitalize()),
-        )
+    logger.info(
+        "Getting temperature map for type: %s, region: %s, period: %s",
+        temp_type,
+        region,
+        period,
+    )
 
-    except ValueError as e:
-        logger.error(f"Invalid request: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error getting temperature map: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error fetching temperature map",
-        )
+    return Response(
+        content=TEMPERATURE_MAP_BODIES[(temp_type, region, period)],
+        media_type="application/json",
+    )
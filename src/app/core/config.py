@@ -1,6 +1,7 @@
 """Application configuration module."""
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -26,10 +27,15 @@ class Settings(BaseSettings):
         SECRET_KEY: Secret key for security.
         ACCESS_TOKEN_EXPIRE_MINUTES: Token expiration time in minutes.
         DATABASE_URL: Database connection string.
+        DB_POOL_SIZE: Connections kept open in the database pool.
+        DB_MAX_OVERFLOW: Extra connections opened under load beyond the pool.
+        DB_POOL_TIMEOUT: Seconds to wait for a free pooled connection.
+        DB_POOL_RECYCLE: Seconds after which pooled connections are replaced.
         ALLOWED_HOSTS: List of allowed hosts.
         OPENWEATHERMAP_API_KEY: API key for OpenWeatherMap service.
         GOOGLE_MAPS_API_KEY: API key for Google Maps service.
         LOG_LEVEL: Logging level.
+        PROXY_IMAGE_CONCURRENCY: Maximum concurrent upstream image proxy fetches.
     """
 
     # Application settings
@@ -45,6 +51,10 @@ class Settings(BaseSettings):
 
     # Database settings
     DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 5
+    DB_POOL_RECYCLE: int = 1800
 
     # CORS settings
     ALLOWED_HOSTS: List[str] = ["*"]
@@ -53,6 +63,9 @@ class Settings(BaseSettings):
     OPENWEATHERMAP_API_KEY: Optional[str] = None
     GOOGLE_MAPS_API_KEY: Optional[str] = None
 
+    # Outbound request settings
+    PROXY_IMAGE_CONCURRENCY: int = 32
+
     # Set model_config to use the appropriate env file
     model_config = SettingsConfigDict(
         case_sensitive=True,
@@ -73,7 +86,7 @@ class Settings(BaseSettings):
         """
         if isinstance(v, str):
             # Log the raw DATABASE_URL for debugging
-            logger.debug(f"Raw DATABASE_URL from env: {v}")
+            logger.debug("Raw DATABASE_URL from env: %s", v)
             return v
         return None
 
@@ -96,20 +109,33 @@ class Settings(BaseSettings):
         return self.ENVIRONMENT.lower() in ("prod", "production")
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, reading the environment only once.
+
+    Returns:
+        Settings instance.
+    """
+    return Settings()
+
+
 # Create settings instance
-settings = Settings()
-
-# Log settings information - useful for debugging
-logger.setLevel(getattr(logging, settings.LOG_LEVEL))
-logger.info(f"Loaded settings for environment: {settings.ENVIRONMENT}")
-# Mask sensitive parts of the database URL
-if settings.DATABASE_URL:
-    db_url_parts = str(settings.DATABASE_URL).split("@")
-    if len(db_url_parts) > 1:
-        masked_url = f"****@{db_url_parts[1]}"
-        logger.info(f"Database URL: {masked_url}")
+settings = get_settings()
+
+
+def log_settings() -> None:
+    """Log the loaded settings, masking the database credentials.
+
+    Called once at application startup, after logging has been configured.
+    """
+    logger.info("Loaded settings for environment: %s", settings.ENVIRONMENT)
+    # Mask sensitive parts of the database URL
+    if settings.DATABASE_URL:
+        db_url_parts = str(settings.DATABASE_URL).rsplit("@", 1)
+        if len(db_url_parts) > 1:
+            logger.info("Database URL: ****@%s", db_url_parts[1])
+        else:
+            logger.info("Database URL is not in the expected format")
     else:
-        logger.info("Database URL is not in the expected format")
-else:
-    logger.info("Database URL is not configured")
-logger.info(f"Debug mode: {settings.DEBUG}")
+        logger.info("Database URL is not configured")
+    logger.info("Debug mode: %s", settings.DEBUG)
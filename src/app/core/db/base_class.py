@@ -5,8 +5,9 @@ from datetime import datetime
 from typing import Any, Dict, TypeVar
 
 from sqlalchemy import Column, DateTime, String
-from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.sql.expression import FunctionElement
 
 
 class Base(DeclarativeBase):
@@ -18,27 +19,52 @@ class Base(DeclarativeBase):
     id: Any
     __name__: str
 
-    # Generate __tablename__ automatically
-    @declared_attr.directive
-    def __tablename__(cls) -> str:
-        """Generate table name from class name.
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Generate a snake_case ``__tablename__`` for models without one.
 
-        Returns:
-            Table name in snake_case format.
+        The name is set before SQLAlchemy maps the class, once per model.
+
+        Args:
+            **kwargs: Keyword arguments for the parent hook.
         """
-        return cls.__name__.lower() + "s"
+        if "__tablename__" not in cls.__dict__:
+            cls.__tablename__ = cls.__name__.lower() + "s"
+        super().__init_subclass__(**kwargs)
+
+
+class UTCNow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UTCNow, "postgresql")
+def _compile_utcnow_postgresql(element: UTCNow, compiler: Any, **kw: Any) -> str:
+    """Compile UTCNow for PostgreSQL, whose session time zone may not be UTC."""
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(UTCNow)
+def _compile_utcnow(element: UTCNow, compiler: Any, **kw: Any) -> str:
+    """Compile UTCNow for databases whose CURRENT_TIMESTAMP is UTC."""
+    return "CURRENT_TIMESTAMP"
 
 
 class TimestampMixin:
-    """Mixin to add created_at and updated_at columns to a model."""
+    """Mixin to add created_at and updated_at columns to a model.
+
+    Timestamps are filled in by the database, so inserts do not send them and
+    the ORM reads them back with RETURNING.
+    """
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=UTCNow(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UTCNow(),
+        onupdate=UTCNow(),
         nullable=False,
     )
 
@@ -1,22 +1,56 @@
 """Database session module."""
 
 import logging
+import threading
 import time
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Dict, Generator
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.app.core.config import settings
+from src.app.core.exceptions import ServiceUnavailableError
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Connection retry settings
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # seconds
+RETRY_DELAY = 2  # seconds, doubled after each failed attempt
+
+# Host part of the database URL, safe to log
+DATABASE_DISPLAY_NAME = (
+    str(settings.DATABASE_URL).rsplit("@", 1)[1]
+    if "@" in str(settings.DATABASE_URL)
+    else "unknown"
+)
+
+# Executemany batching for the psycopg2 driver
+INSERTMANYVALUES_PAGE_SIZE = 1000
+EXECUTEMANY_BATCH_PAGE_SIZE = 500
+
+
+def _dialect_engine_options(database_url: str) -> Dict[str, Any]:
+    """Get driver-specific engine options.
+
+    Args:
+        database_url: Database connection string.
+
+    Returns:
+        Extra keyword arguments for ``create_engine``.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() == "psycopg2":
+        # Send executemany INSERTs as multi-VALUES statements and batch the rest
+        return {
+            "executemany_mode": "values_plus_batch",
+            "insertmanyvalues_page_size": INSERTMANYVALUES_PAGE_SIZE,
+            "executemany_batch_page_size": EXECUTEMANY_BATCH_PAGE_SIZE,
+        }
+    return {}
 
 
 class DatabaseSessionManager:
@@ -32,10 +66,16 @@ class DatabaseSessionManager:
         self.engine = None
         self.session_factory = None
         self._initialized = False
+        self._lock = threading.Lock()
+        self._connect_calls = 0
 
     def initialize(self, retry: bool = True) -> bool:
         """Initialize the database engine and session factory.
 
+        Sessions are opened from FastAPI's threadpool, so only one thread at a
+        time may connect; threads that waited for it reuse its outcome instead
+        of retrying again.
+
         Args:
             retry: Whether to retry the connection on failure.
 
@@ -45,12 +85,26 @@ class DatabaseSessionManager:
         if self._initialized:
             return True
 
+        connect_calls = self._connect_calls
+        with self._lock:
+            if self._initialized or self._connect_calls != connect_calls:
+                return self._initialized
+            self._connect_calls += 1
+            return self._connect(retry)
+
+    def _connect(self, retry: bool) -> bool:
+        """Create the engine and session factory, retrying with backoff.
+
+        Args:
+            retry: Whether to retry the connection on failure.
+
+        Returns:
+            True if the connection succeeded, False otherwise.
+        """
         retry_count = 0
         while retry_count < MAX_RETRIES:
             try:
-                logger.info(
-                    f"Connecting to database: {settings.DATABASE_URL.split('@')[1] if '@' in str(settings.DATABASE_URL) else 'unknown'}"
-                )
+                logger.info("Connecting to database: %s", DATABASE_DISPLAY_NAME)
 
                 # Create engine
                 self.engine = create_engine(
@@ -58,9 +112,11 @@ class DatabaseSessionManager:
                     echo=settings.DEBUG,
                     future=True,
                     pool_pre_ping=True,
-                    pool_size=5,
-                    max_overflow=10,
-                    pool_timeout=30,
+                    pool_size=settings.DB_POOL_SIZE,
+                    max_overflow=settings.DB_MAX_OVERFLOW,
+                    pool_timeout=settings.DB_POOL_TIMEOUT,
+                    pool_recycle=settings.DB_POOL_RECYCLE,
+                    **_dialect_engine_options(str(settings.DATABASE_URL)),
                 )
 
                 # Create session factory
@@ -80,19 +136,24 @@ class DatabaseSessionManager:
                 return True
 
             except SQLAlchemyError as e:
+                # Release the failed engine's pool before building a new one
+                if self.engine is not None:
+                    self.engine.dispose()
+                    self.engine = None
                 retry_count += 1
                 logger.warning(
-                    f"Database connection attempt {retry_count} failed: {str(e)}"
+                    "Database connection attempt %s failed: %s", retry_count, e
                 )
 
                 if not retry or retry_count >= MAX_RETRIES:
                     logger.error(
-                        f"Failed to connect to database after {retry_count} attempts"
+                        "Failed to connect to database after %s attempts", retry_count
                     )
                     break
 
-                logger.info(f"Retrying in {RETRY_DELAY} seconds...")
-                time.sleep(RETRY_DELAY)
+                delay = RETRY_DELAY * 2 ** (retry_count - 1)
+                logger.info("Retrying in %s seconds...", delay)
+                time.sleep(delay)
 
         return False
 
@@ -102,51 +163,25 @@ class DatabaseSessionManager:
 
         Yields:
             Session: Database session.
+
+        Raises:
+            ServiceUnavailableError: If the database cannot be connected to.
         """
         if not self._initialized:
             success = self.initialize()
             if not success:
-                raise RuntimeError("Database connection is not initialized")
+                raise ServiceUnavailableError("Database is unavailable")
 
         session = self.session_factory()
         try:
             yield session
         except SQLAlchemyError as e:
-            logger.exception(f"Database session error: {str(e)}")
+            logger.exception("Database session error: %s", e)
             session.rollback()
             raise
         finally:
             session.close()
 
-    def get_dummy_session(self) -> Generator[Session, None, None]:
-        """Get a dummy session when database is not available.
-
-        Yields:
-            A mock session that raises exceptions when used.
-        """
-
-        class DummySession:
-            def execute(self, *args, **kwargs):
-                raise RuntimeError("No database connection available")
-
-            def commit(self):
-                raise RuntimeError("No database connection available")
-
-            def rollback(self):
-                pass
-
-            def close(self):
-                pass
-
-        def _get_session():
-            session = DummySession()
-            try:
-                yield session
-            finally:
-                session.close()
-
-        return _get_session()
-
 
 # Create a singleton instance
 db_manager = DatabaseSessionManager()
@@ -155,15 +190,11 @@ db_manager = DatabaseSessionManager()
 def get_db() -> Generator[Session, None, None]:
     """Get database session.
 
-    This is the dependency to be used in FastAPI endpoints.
+    This is the dependency to be used in FastAPI endpoints. If the database
+    cannot be reached the request fails with 503 before the endpoint runs.
 
     Yields:
         Session: Database session.
     """
-    try:
-        with db_manager.session() as session:
-            yield session
-    except RuntimeError as e:
-        logger.warning(f"Using dummy database session: {str(e)}")
-        for session in db_manager.get_dummy_session():
-            yield session
+    with db_manager.session() as session:
+        yield session
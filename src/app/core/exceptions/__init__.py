@@ -4,7 +4,9 @@ from src.app.core.exceptions.base import (
     ApplicationError,
     AuthenticationError,
     AuthorizationError,
+    ConflictError,
     NotFoundError,
+    ServiceUnavailableError,
     ValidationError,
 )
 
@@ -12,6 +14,8 @@ __all__ = [
     "ApplicationError",
     "AuthenticationError",
     "AuthorizationError",
+    "ConflictError",
     "NotFoundError",
+    "ServiceUnavailableError",
     "ValidationError",
 ]
\ No newline at end of file
@@ -1,32 +1,41 @@
 """Base exceptions module."""
 
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
 
 
 class ApplicationError(Exception):
     """Base exception for all application errors.
 
+    Subclasses set ``default_status_code`` and ``default_message`` rather than
+    overriding ``__init__``.
+
     Attributes:
         message: Error message.
         status_code: HTTP status code.
         details: Additional error details.
     """
 
+    default_status_code: ClassVar[int] = 500
+    default_message: ClassVar[str] = "Application error"
+
     def __init__(
         self,
-        message: str,
-        status_code: int = 500,
+        message: Optional[str] = None,
+        status_code: Optional[int] = None,
         details: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Initialize ApplicationError.
 
         Args:
-            message: Error message.
-            status_code: HTTP status code.
+            message: Error message. Defaults to the class's ``default_message``.
+            status_code: HTTP status code. Defaults to the class's
+                ``default_status_code``.
             details: Additional error details.
         """
-        self.message = message
-        self.status_code = status_code
+        self.message = self.default_message if message is None else message
+        self.status_code = (
+            self.default_status_code if status_code is None else status_code
+        )
         self.details = details
         super().__init__(self.message)
 
@@ -37,18 +46,8 @@ class ValidationError(ApplicationError):
     Raised when input data fails validation.
     """
 
-    def __init__(
-        self,
-        message: str = "Validation error",
-        details: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Initialize ValidationError.
-
-        Args:
-            message: Error message.
-            details: Additional error details.
-        """
-        super().__init__(message=message, status_code=400, details=details)
+    default_status_code = 400
+    default_message = "Validation error"
 
 
 class AuthenticationError(ApplicationError):
@@ -57,18 +56,8 @@ class AuthenticationError(ApplicationError):
     Raised when authentication fails.
     """
 
-    def __init__(
-        self,
-        message: str = "Authentication error",
-        details: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Initialize AuthenticationError.
-
-        Args:
-            message: Error message.
-            details: Additional error details.
-        """
-        super().__init__(message=message, status_code=401, details=details)
+    default_status_code = 401
+    default_message = "Authentication error"
 
 
 class AuthorizationError(ApplicationError):
@@ -77,18 +66,8 @@ class AuthorizationError(ApplicationError):
     Raised when user is not authorized to perform an action.
     """
 
-    def __init__(
-        self,
-        message: str = "Authorization error",
-        details: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Initialize AuthorizationError.
-
-        Args:
-            message: Error message.
-            details: Additional error details.
-        """
-        super().__init__(message=message, status_code=403, details=details)
+    default_status_code = 403
+    default_message = "Authorization error"
 
 
 class NotFoundError(ApplicationError):
@@ -97,15 +76,25 @@ class NotFoundError(ApplicationError):
     Raised when a requested resource is not found.
     """
 
-    def __init__(
-        self,
-        message: str = "Resource not found",
-        details: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Initialize NotFoundError.
+    default_status_code = 404
+    default_message = "Resource not found"
 
-        Args:
-            message: Error message.
-            details: Additional error details.
-        """
-        super().__init__(message=message, status_code=404, details=details)
\ No newline at end of file
+
+class ConflictError(ApplicationError):
+    """Conflict error exception.
+
+    Raised when a request conflicts with the current state of a resource.
+    """
+
+    default_status_code = 409
+    default_message = "Resource conflict"
+
+
+class ServiceUnavailableError(ApplicationError):
+    """Service unavailable error exception.
+
+    Raised when a backing service, such as the database, cannot be reached.
+    """
+
+    default_status_code = 503
+    default_message = "Service unavailable"
@@ -1,8 +1,12 @@
 """Exception handlers module."""
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.utils import is_body_allowed_for_status_code
 from pydantic import ValidationError as PydanticValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.app.core.exceptions.base import ApplicationError
 
@@ -17,7 +21,7 @@ def add_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(ApplicationError)
     async def handle_application_error(
         request: Request, exc: ApplicationError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle ApplicationError exceptions.
 
         Args:
@@ -27,7 +31,7 @@ def add_exception_handlers(app: FastAPI) -> None:
         Returns:
             JSON response with error details.
         """
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": {
@@ -41,7 +45,7 @@ def add_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(PydanticValidationError)
     async def handle_validation_error(
         request: Request, exc: PydanticValidationError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle Pydantic ValidationError exceptions.
 
         Args:
@@ -51,7 +55,7 @@ def add_exception_handlers(app: FastAPI) -> None:
         Returns:
             JSON response with error details.
         """
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "error": {
@@ -60,4 +64,46 @@ def add_exception_handlers(app: FastAPI) -> None:
                     "status_code": 400,
                 }
             },
-        )
\ No newline at end of file
+        )
+
+    # FastAPI's built-in handlers for these respond with the stdlib-backed
+    # JSONResponse; keep their response bodies but serialize with orjson
+    @app.exception_handler(StarletteHTTPException)
+    async def handle_http_exception(
+        request: Request, exc: StarletteHTTPException
+    ) -> Response:
+        """Handle HTTPException exceptions.
+
+        Args:
+            request: Request instance.
+            exc: HTTPException instance.
+
+        Returns:
+            JSON response with the exception detail.
+        """
+        headers = getattr(exc, "headers", None)
+        if not is_body_allowed_for_status_code(exc.status_code):
+            return Response(status_code=exc.status_code, headers=headers)
+        return ORJSONResponse(
+            status_code=exc.status_code,
+            content={"detail": exc.detail},
+            headers=headers,
+        )
+
+    @app.exception_handler(RequestValidationError)
+    async def handle_request_validation_error(
+        request: Request, exc: RequestValidationError
+    ) -> ORJSONResponse:
+        """Handle RequestValidationError exceptions.
+
+        Args:
+            request: Request instance.
+            exc: RequestValidationError instance.
+
+        Returns:
+            JSON response with the validation errors.
+        """
+        return ORJSONResponse(
+            status_code=422,
+            content={"detail": jsonable_encoder(exc.errors())},
+        )
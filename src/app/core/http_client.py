@@ -0,0 +1,58 @@
+"""Shared outbound HTTP client module."""
+
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool and timeout settings for upstream API calls. Idle
+# connections are dropped after 30s, before upstreams tend to close them, and
+# waiting for a free pooled connection is bounded like connecting is.
+HTTP_TIMEOUT = httpx.Timeout(connect=3.0, read=10.0, write=5.0, pool=5.0)
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+)
+
+
+class HTTPClientManager:
+    """Manager for the application's shared outbound HTTP client.
+
+    A single ``httpx.AsyncClient`` is reused for all upstream API calls so
+    connections (and their TLS sessions) are kept alive and pooled between
+    requests instead of being set up for each call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize HTTPClientManager."""
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the shared client, creating it on first use.
+
+        Returns:
+            Shared HTTP client.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT
+            )
+            logger.info("Outbound HTTP client created")
+        return self._client
+
+    def start(self) -> None:
+        """Create the shared client ahead of the first request."""
+        _ = self.client
+
+    async def close(self) -> None:
+        """Close the shared client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("Outbound HTTP client closed")
+
+
+# Create a singleton instance
+http_client_manager = HTTPClientManager()
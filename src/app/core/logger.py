@@ -1,23 +1,56 @@
 """Logging configuration module."""
 
+import atexit
+import functools
 import logging
+import queue
 import sys
-from typing import Any, Dict, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple
 
 from src.app.core.config import settings
 
+# Writes log records to stdout from a background thread, started on first setup
+_log_listener: Optional[QueueListener] = None
+
 
 def setup_logging() -> None:
-    """Configure logging for the application."""
-    log_level = logging.DEBUG if settings.DEBUG else logging.INFO
+    """Configure logging for the application.
+
+    Records are handed to a queue and written to stdout by a background
+    thread, so logging calls never block on terminal or pipe I/O.
+    """
+    global _log_listener
+
+    # LOG_LEVEL lets deployments raise the level (e.g. WARNING) to skip
+    # per-request INFO records entirely
+    log_level = (
+        logging.DEBUG
+        if settings.DEBUG
+        else getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
+    )
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # The format does not use them, so skip collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    if _log_listener is None:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter(log_format))
+        _log_listener = QueueListener(queue.SimpleQueue(), stream_handler)
+        _log_listener.start()
+        # Flush queued records before the interpreter exits
+        atexit.register(_log_listener.stop)
+
+    # The queue handler only merges the message with its arguments; the
+    # listener's handler applies the full format
+    queue_handler = QueueHandler(_log_listener.queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format=log_format,
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    logging.basicConfig(level=log_level, handlers=[queue_handler])
 
     # Set log levels for third-party libraries
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -27,6 +60,8 @@ def setup_logging() -> None:
     )
 
 
+# Loggers are never replaced once created, so lookups can skip the module lock
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance.
 
@@ -42,7 +77,8 @@ def get_logger(name: str) -> logging.Logger:
 class LoggerAdapter(logging.LoggerAdapter):
     """Logger adapter with context information.
 
-    This adapter adds context information to log messages.
+    This adapter adds context information to log messages. The context suffix
+    is formatted once, when the context is set, rather than for every record.
     """
 
     def __init__(
@@ -54,9 +90,31 @@ class LoggerAdapter(logging.LoggerAdapter):
             logger: Logger instance.
             context: Context information.
         """
-        super().__init__(logger, context or {})
+        super().__init__(logger, dict(context or {}))
+        self._context_suffix = self._format_context()
+
+    def update_context(self, **context: Any) -> None:
+        """Add or replace context information.
+
+        Args:
+            **context: Context values to set.
+        """
+        self.extra.update(context)
+        self._context_suffix = self._format_context()
 
-    def process(self, msg: str, kwargs: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
+    def _format_context(self) -> str:
+        """Format the context as a message suffix.
+
+        Returns:
+            Suffix to append to log messages, or an empty string if there is
+            no context.
+        """
+        if not self.extra:
+            return ""
+        context_str = " ".join(f"{k}={v}" for k, v in self.extra.items())
+        return f" [{context_str}]"
+
+    def process(self, msg: str, kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
         """Process log message.
 
         Args:
@@ -66,5 +124,6 @@ class LoggerAdapter(logging.LoggerAdapter):
         Returns:
             Processed message and keyword arguments.
         """
-        context_str = " ".join(f"{k}={v}" for k, v in self.extra.items())
-        return f"{msg} [{context_str}]", kwargs
+        if not self._context_suffix:
+            return msg, kwargs
+        return f"{msg}{self._context_suffix}", kwargs
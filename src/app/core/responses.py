@@ -0,0 +1,65 @@
+"""Response helpers module."""
+
+from decimal import Decimal
+from typing import Any, Mapping, Optional
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import DeclarativeBase
+
+
+def _default(obj: Any) -> Any:
+    """Convert values orjson cannot serialize natively.
+
+    Args:
+        obj: Value to convert.
+
+    Returns:
+        JSON-serializable representation of the value.
+
+    Raises:
+        TypeError: If the value's type is not supported.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Row):
+        return obj._asdict()
+    if isinstance(obj, DeclarativeBase):
+        # Column values only; relationships are never loaded implicitly
+        return {
+            attr.key: getattr(obj, attr.key)
+            for attr in inspect(obj).mapper.column_attrs
+        }
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def orjson_response(
+    data: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """Serialize data straight to a JSON response.
+
+    Returning the response from a route skips FastAPI's response model
+    validation and ``jsonable_encoder`` pass, which dominate the cost of large
+    list responses.
+
+    Args:
+        data: Data to serialize. datetimes and UUIDs are handled by orjson;
+            Decimals, result rows, ORM instances and Pydantic models by
+            ``_default``.
+        status_code: HTTP status code.
+        headers: Extra response headers.
+
+    Returns:
+        JSON response.
+    """
+    return Response(
+        content=orjson.dumps(data, default=_default),
+        media_type="application/json",
+        status_code=status_code,
+        headers=headers,
+    )
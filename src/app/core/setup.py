@@ -1,13 +1,53 @@
 """Application setup module."""
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.app.api import api_router
-from src.app.core.config import settings
+from src.app.core.config import log_settings, settings
+from src.app.core.db.session import db_manager
 from src.app.core.exceptions.handlers import add_exception_handlers
+from src.app.core.http_client import http_client_manager
 from src.app.core.logger import setup_logging
 
+# Cross-origin access: the frontend and local development servers
+CORS_ALLOWED_ORIGINS = (
+    "https://uvchecker.net",
+    "https://api.uvchecker.net",
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+)
+CORS_ALLOWED_METHODS = ("GET", "POST", "OPTIONS")
+CORS_ALLOWED_HEADERS = ("Authorization", "Content-Type")
+# Let browsers reuse a preflight result for a day
+CORS_MAX_AGE = 86400
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Set up and tear down shared resources for the application.
+
+    Args:
+        app: FastAPI application.
+
+    Yields:
+        None while the application is running.
+    """
+    log_settings()
+    http_client_manager.start()
+    # Connect ahead of the first request; if the database is down, requests
+    # needing it get a 503 and retry the connection themselves
+    await run_in_threadpool(db_manager.initialize, False)
+    try:
+        yield
+    finally:
+        await http_client_manager.close()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
@@ -26,20 +66,18 @@ def create_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            "https://uvchecker.net",
-            "https://api.uvchecker.net",
-            "http://localhost:3000",
-            "http://127.0.0.1:3000",
-        ],
+        allow_origins=CORS_ALLOWED_ORIGINS,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=CORS_ALLOWED_METHODS,
+        allow_headers=CORS_ALLOWED_HEADERS,
+        max_age=CORS_MAX_AGE,
     )
 
     # Add exception handlers
@@ -0,0 +1,6 @@
+"""Utility functions and helpers."""
+
+from src.app.core.utils.cache import TTLCache
+from src.app.core.utils.singleflight import SingleFlight
+
+__all__ = ["SingleFlight", "TTLCache"]
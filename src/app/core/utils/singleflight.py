@@ -0,0 +1,54 @@
+"""Deduplication of concurrent identical async calls."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """Share one in-flight call between concurrent callers using the same key.
+
+    The first caller for a key starts the call; callers arriving while it is
+    still running await the same result instead of starting their own. The
+    call runs as a separate task, so a cancelled caller does not cancel it for
+    the others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize SingleFlight."""
+        self._calls: Dict[K, "asyncio.Task[V]"] = {}
+
+    async def do(self, key: K, func: Callable[[], Awaitable[V]]) -> V:
+        """Run ``func`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Key identifying identical calls.
+            func: Zero-argument coroutine function performing the call.
+
+        Returns:
+            The result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: "asyncio.Task[V]") -> None:
+        """Drop a finished call so the next caller starts a fresh one.
+
+        Args:
+            key: Key of the finished call.
+            task: The finished task.
+        """
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
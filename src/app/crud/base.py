@@ -1,10 +1,22 @@
 """Base CRUD operations module."""
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import BaseModel
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Load, Mapper, Session, selectinload
 
 from src.app.core.db.base_class import Base
 
@@ -12,6 +24,15 @@ ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# Rows per INSERT statement for bulk inserts
+BULK_INSERT_CHUNK_SIZE = 10_000
+
+# Dialects whose INSERT supports ON CONFLICT ... RETURNING
+UPSERT_INSERTS: Dict[str, Callable[..., Any]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base class for CRUD operations.
@@ -58,20 +79,20 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         return result.scalars().all()
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
-        """Create a new record.
+        """Create a new record with a single INSERT ... RETURNING statement.
 
         Args:
             db: Database session.
             obj_in: Input data.
 
         Returns:
-            Created record.
+            Created record, including its generated and server-side defaults.
         """
-        obj_in_data = obj_in.model_dump()
-        db_obj = self.model(**obj_in_data)
-        db.add(db_obj)
+        result = db.execute(
+            insert(self.model).values(**obj_in.model_dump()).returning(self.model)
+        )
+        db_obj = result.scalar_one()
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
     def update(
@@ -81,32 +102,93 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj: ModelType,
         obj_in: Union[UpdateSchemaType, Dict[str, Any]],
     ) -> ModelType:
-        """Update a record.
+        """Update a record with a single UPDATE ... RETURNING statement.
 
         Args:
             db: Database session.
             db_obj: Database object to update.
-            obj_in: Input data.
+            obj_in: Input data. Keys that are not columns of the model are
+                ignored.
 
         Returns:
-            Updated record.
+            Updated record, refreshed from the returned row.
         """
-        obj_data = db_obj.__dict__
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
-        db.add(db_obj)
+        columns = self.model.__mapper__.column_attrs.keys()
+        values = {
+            field: value for field, value in update_data.items() if field in columns
+        }
+        if not values:
+            return db_obj
+
+        result = db.execute(
+            update(self.model)
+            .where(self.model.id == db_obj.id)
+            .values(**values)
+            .returning(self.model),
+            execution_options={"populate_existing": True},
+        )
+        db_obj = result.scalar_one()
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
+    def _save(self, db: Session, db_obj: ModelType, *, commit: bool = True) -> None:
+        """Add a record to the session and persist it.
+
+        Server-side defaults are read back with RETURNING when the record is
+        flushed, and sessions do not expire objects on commit, so the record
+        is complete without a refresh.
+
+        Args:
+            db: Database session.
+            db_obj: Database object to save.
+            commit: Whether to commit the record. When False the record is only
+                flushed, leaving the caller to commit.
+        """
+        db.add(db_obj)
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+
+    def _bulk_insert(
+        self, db: Session, rows: Sequence[Dict[str, Any]], *, commit: bool = True
+    ) -> None:
+        """Insert many rows as executemany batches, without loading ORM objects.
+
+        Args:
+            db: Database session.
+            rows: Column values for each new record.
+            commit: Whether to commit once all rows are inserted.
+        """
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            db.execute(insert(self.model), rows[start : start + BULK_INSERT_CHUNK_SIZE])
+        if commit:
+            db.commit()
+
+    def _upsert_insert(self, db: Session) -> Optional[Callable[..., Any]]:
+        """Get the ``insert`` construct supporting ON CONFLICT for a session.
+
+        Args:
+            db: Database session.
+
+        Returns:
+            Dialect-specific ``insert`` function, or None if the database does
+            not support upserts.
+        """
+        return UPSERT_INSERTS.get(db.get_bind().dialect.name)
+
     def remove(self, db: Session, *, id: Any) -> Optional[ModelType]:
         """Remove a record.
 
+        Models without delete-cascading relationships are removed with a single
+        DELETE ... RETURNING statement. Otherwise the record is loaded, with
+        its dependents eagerly loaded one query per relationship, and deleted
+        through the ORM so its dependent rows are removed too.
+
         Args:
             db: Database session.
             id: Record ID.
@@ -114,8 +196,51 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Removed record if found, None otherwise.
         """
-        obj = self.get(db, id)
-        if obj:
-            db.delete(obj)
-            db.commit()
+        cascade_loads = _cascade_delete_loads(self.model.__mapper__)
+        if cascade_loads:
+            result = db.execute(
+                select(self.model).where(self.model.id == id).options(*cascade_loads)
+            )
+            obj = result.scalars().first()
+            if obj:
+                db.delete(obj)
+                db.commit()
+            return obj
+
+        result = db.execute(
+            delete(self.model).where(self.model.id == id).returning(self.model)
+        )
+        obj = result.scalar_one_or_none()
+        db.commit()
         return obj
+
+
+def _cascade_delete_loads(
+    mapper: Mapper[Any], parent: Optional[Load] = None
+) -> List[Load]:
+    """Build eager loader options for every delete-cascading relationship.
+
+    Deleting a record through the ORM loads each cascaded collection; loading
+    them up front with ``selectinload`` replaces one query per parent row with
+    one query per relationship.
+
+    Args:
+        mapper: Mapper of the model being deleted.
+        parent: Loader option for the relationship leading to ``mapper``.
+
+    Returns:
+        Loader options, empty if the model has no delete-cascading
+        relationships.
+    """
+    loads = []
+    for rel in mapper.relationships:
+        if not rel.cascade.delete:
+            continue
+        load = (
+            selectinload(rel.class_attribute)
+            if parent is None
+            else parent.selectinload(rel.class_attribute)
+        )
+        loads.append(load)
+        loads.extend(_cascade_delete_loads(rel.mapper, load))
+    return loads
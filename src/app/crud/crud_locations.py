@@ -2,8 +2,8 @@
 
 from typing import List, Optional
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import Session, selectinload
 
 from src.app.crud.base import CRUDBase
 from src.app.models.location import Location
@@ -26,28 +26,41 @@ class LocationCRUD(CRUDBase[Location, LocationInfo, LocationInfo]):
         Returns:
             Location if found, None otherwise.
         """
+        # Built and cached once; the coordinates are extracted as bound parameters
         result = db.execute(
-            select(self.model).where(
-                self.model.latitude == latitude, self.model.longitude == longitude
+            lambda_stmt(
+                lambda: select(Location).where(
+                    Location.latitude == latitude, Location.longitude == longitude
+                )
             )
         )
         return result.scalars().first()
 
-    def get_by_user_id(self, db: Session, *, user_id: str) -> List[Location]:
+    def get_by_user_id(
+        self, db: Session, *, user_id: str, with_records: bool = False
+    ) -> List[Location]:
         """Get locations by user ID.
 
         Args:
             db: Database session.
             user_id: User ID.
+            with_records: Whether to also load each location's temperature and
+                UV records, with one query per collection for all locations.
 
         Returns:
             List of locations.
         """
-        result = db.execute(select(self.model).where(self.model.user_id == user_id))
+        stmt = select(self.model).where(self.model.user_id == user_id)
+        if with_records:
+            stmt = stmt.options(
+                selectinload(self.model.temperature_records),
+                selectinload(self.model.uv_records),
+            )
+        result = db.execute(stmt)
         return result.scalars().all()
 
     def create_with_user(
-        self, db: Session, *, obj_in: dict, user_id: str
+        self, db: Session, *, obj_in: dict, user_id: str, commit: bool = True
     ) -> Location:
         """Create a new location with user ID.
 
@@ -55,6 +68,8 @@ class LocationCRUD(CRUDBase[Location, LocationInfo, LocationInfo]):
             db: Database session.
             obj_in: Input data.
             user_id: User ID.
+            commit: Whether to commit the transaction. When False the record
+                is only flushed, leaving the caller to commit.
 
         Returns:
             Created location.
@@ -68,11 +83,58 @@ class LocationCRUD(CRUDBase[Location, LocationInfo, LocationInfo]):
             country=obj_in.get("country"),
             user_id=user_id,
         )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._save(db, db_obj, commit=commit)
         return db_obj
 
+    def get_or_create_with_user(
+        self, db: Session, *, obj_in: dict, user_id: str, commit: bool = True
+    ) -> Location:
+        """Get the location at the given coordinates or create it with user ID.
+
+        Where the database supports it this is a single
+        ``INSERT ... ON CONFLICT (latitude, longitude) DO UPDATE ... RETURNING``
+        round-trip. An existing location is returned unchanged.
+
+        Args:
+            db: Database session.
+            obj_in: Input data.
+            user_id: User ID, used only if the location is created.
+            commit: Whether to commit the transaction. When False a new
+                location is only flushed, leaving the caller to commit.
+
+        Returns:
+            Existing or created location.
+        """
+        insert = self._upsert_insert(db)
+        if insert is None:
+            location = self.get_by_coordinates(
+                db, latitude=obj_in["lat"], longitude=obj_in["lon"]
+            )
+            if location is None:
+                location = self.create_with_user(
+                    db, obj_in=obj_in, user_id=user_id, commit=commit
+                )
+            return location
+
+        stmt = insert(self.model).values(
+            latitude=obj_in["lat"],
+            longitude=obj_in["lon"],
+            city=obj_in.get("city"),
+            state=None,  # Not provided in the current API response
+            postcode=None,  # Not provided in the current API response
+            country=obj_in.get("country"),
+            user_id=user_id,
+        )
+        # DO UPDATE rather than DO NOTHING so RETURNING yields existing rows
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.latitude, self.model.longitude],
+            set_={"latitude": stmt.excluded.latitude},
+        ).returning(self.model)
+        location = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+        if commit:
+            db.commit()
+        return location
+
 
 # Create a singleton instance
-location_crud = LocationCRUD(Location)
\ No newline at end of file
+location_crud = LocationCRUD(Location)
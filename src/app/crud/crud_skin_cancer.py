@@ -1,18 +1,41 @@
 """CRUD operations for skin cancer data."""
 
-from typing import Dict, List
+import operator
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Type
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from src.app.core.utils.cache import TTLCache
 from src.app.crud.base import CRUDBase
 from src.app.models.skin_cancer_data import SkinCancerData
 from src.app.schemas.skin_cancer import SkinCancerFilter
 
+# The table only changes on manual re-imports, so aggregations can be kept long.
+# The import runs in a separate process and cannot clear these in-process
+# caches: results may lag a reload by up to GROUPED_DATA_CACHE_TTL seconds
+# unless the API is restarted
+GROUPED_DATA_CACHE_MAXSIZE = 1024
+GROUPED_DATA_CACHE_TTL = 3600
+
 
 class CRUDSkinCancer(CRUDBase[SkinCancerData, None, None]):
     """CRUD operations for skin cancer data."""
 
+    def __init__(self, model: Type[SkinCancerData]) -> None:
+        """Initialize CRUDSkinCancer.
+
+        Args:
+            model: SQLAlchemy model class.
+        """
+        super().__init__(model)
+        self._grouped_data_cache: TTLCache[Tuple[Hashable, ...], Dict] = TTLCache(
+            maxsize=GROUPED_DATA_CACHE_MAXSIZE, ttl=GROUPED_DATA_CACHE_TTL
+        )
+        self._count_cache: TTLCache[Tuple[Hashable, ...], int] = TTLCache(
+            maxsize=GROUPED_DATA_CACHE_MAXSIZE, ttl=GROUPED_DATA_CACHE_TTL
+        )
+
     def get_filtered(
         self, db: Session, *, filters: SkinCancerFilter, skip: int = 0, limit: int = 100
     ) -> List[SkinCancerData]:
@@ -33,9 +56,42 @@ class CRUDSkinCancer(CRUDBase[SkinCancerData, None, None]):
         result = db.execute(query)
         return result.scalars().all()
 
+    def get_filtered_with_total(
+        self, db: Session, *, filters: SkinCancerFilter, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[SkinCancerData], int]:
+        """Get a page of filtered skin cancer data and the total match count.
+
+        The total is computed with ``count(*) OVER ()`` in the same query as the
+        page, so both come back in a single round-trip.
+
+        Args:
+            db: Database session.
+            filters: Filter criteria.
+            skip: Number of records to skip.
+            limit: Maximum number of records to return.
+
+        Returns:
+            Tuple of the records on the page and the count of all records
+            matching the filter criteria.
+        """
+        query = select(self.model, func.count().over().label("total"))
+        query = self._apply_filters(query, filters)
+        query = query.offset(skip).limit(limit)
+        rows = db.execute(query).all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        # An empty page past the end carries no window total, so count directly
+        total = self.count_filtered(db, filters=filters) if skip else 0
+        return [], total
+
     def count_filtered(self, db: Session, *, filters: SkinCancerFilter) -> int:
         """Count filtered skin cancer data.
 
+        Counts are cached per filter combination for up to
+        ``GROUPED_DATA_CACHE_TTL`` seconds, so they may lag a data reload.
+
         Args:
             db: Database session.
             filters: Filter criteria.
@@ -43,10 +99,18 @@ class CRUDSkinCancer(CRUDBase[SkinCancerData, None, None]):
         Returns:
             Count of records matching the filter criteria.
         """
+        cache_key = _filter_key(filters)
+        cached = self._count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         query = select(func.count()).select_from(self.model)
         query = self._apply_filters(query, filters)
         result = db.execute(query)
-        return result.scalar_one()
+        total = result.scalar_one()
+
+        self._count_cache.set(cache_key, total)
+        return total
 
     def get_grouped_data(
         self,
@@ -65,7 +129,10 @@ class CRUDSkinCancer(CRUDBase[SkinCancerData, None, None]):
             metrics: Metrics to aggregate.
 
         Returns:
-            Grouped data for visualization.
+            Grouped data for visualization, with the summed count across all
+            groups under ``total``. Results are cached per filter combination
+            for up to ``GROUPED_DATA_CACHE_TTL`` seconds, so they may lag a
+            data reload.
         """
         # Validate group_by fields
         valid_fields = [
@@ -79,6 +146,11 @@ class CRUDSkinCancer(CRUDBase[SkinCancerData, None, None]):
         if not group_by:
             raise ValueError("At least one valid field must be specified for grouping")
 
+        cache_key = (*_filter_key(filters), tuple(group_by), tuple(metrics))
+        cached = self._grouped_data_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Build select columns
         select_columns = []
         for field in group_by:
@@ -89,6 +161,11 @@ class CRUDSkinCancer(CRUDBase[SkinCancerData, None, None]):
             if metric == "count":
                 select_columns.append(func.sum(self.model.count).label("count"))
 
+        # Grand total across all groups, computed in the same statement
+        select_columns.append(
+            func.sum(func.sum(self.model.count)).over().label("grand_total")
+        )
+
         # Build query
         query = select(*select_columns)
         query = self._apply_filters(query, filters)
@@ -100,6 +177,9 @@ class CRUDSkinCancer(CRUDBase[SkinCancerData, None, None]):
 
         # Format result for visualization
         formatted_data = self._format_grouped_data(rows, group_by, metrics)
+        formatted_data["total"] = rows[0].grand_total if rows else 0
+
+        self._grouped_data_cache.set(cache_key, formatted_data)
         return formatted_data
 
     def _apply_filters(self, query, filters: SkinCancerFilter):
@@ -112,22 +192,17 @@ class CRUDSkinCancer(CRUDBase[SkinCancerData, None, None]):
         Returns:
             Filtered query.
         """
-        filter_conditions = []
-
         # Always filter by cancer_group = "Melanoma of the skin"
-        filter_conditions.append(self.model.cancer_group == "Melanoma of the skin")
+        query = query.where(self.model.cancer_group == "Melanoma of the skin")
 
         if filters.data_type:
-            filter_conditions.append(self.model.data_type == filters.data_type)
+            query = query.where(self.model.data_type == filters.data_type)
         if filters.year:
-            filter_conditions.append(self.model.year == filters.year)
+            query = query.where(self.model.year == filters.year)
         if filters.sex:
-            filter_conditions.append(self.model.sex == filters.sex)
+            query = query.where(self.model.sex == filters.sex)
         if filters.age_group:
-            filter_conditions.append(self.model.age_group == filters.age_group)
-
-        if filter_conditions:
-            query = query.where(and_(*filter_conditions))
+            query = query.where(self.model.age_group == filters.age_group)
 
         return query
 
@@ -144,55 +219,67 @@ class CRUDSkinCancer(CRUDBase[SkinCancerData, None, None]):
         Returns:
             Formatted data for visualization.
         """
+        # Resolve the row accessors once rather than per row and field
+        get_keys = _tuple_getter(group_by)
+        get_metrics = _tuple_getter(metrics)
         result = {}
 
         # Handle different grouping scenarios
         if len(group_by) == 1:
             # Simple grouping by one field
-            field = group_by[0]
-            result[field] = {}
+            grouped = result[group_by[0]] = {}
 
             for row in rows:
-                key = getattr(row, field)
-                result[field][key] = {}
-
-                for metric in metrics:
-                    result[field][key][metric] = getattr(row, metric)
+                (key,) = get_keys(row)
+                grouped[key] = dict(zip(metrics, get_metrics(row)))
 
         elif len(group_by) == 2:
             # Two-dimensional grouping (e.g., year and sex)
             field1, field2 = group_by
-            result[f"{field1}_{field2}"] = {}
+            grouped = result[f"{field1}_{field2}"] = {}
 
             for row in rows:
-                key1 = getattr(row, field1)
-                key2 = getattr(row, field2)
+                key1, key2 = get_keys(row)
+                grouped.setdefault(key1, {})[key2] = dict(
+                    zip(metrics, get_metrics(row))
+                )
+        else:
+            # Multi-dimensional grouping - convert to nested structure
+            fields = group_by + metrics
+            result["data"] = [
+                dict(zip(fields, get_keys(row) + get_metrics(row))) for row in rows
+            ]
 
-                if key1 not in result[f"{field1}_{field2}"]:
-                    result[f"{field1}_{field2}"][key1] = {}
+        return result
 
-                result[f"{field1}_{field2}"][key1][key2] = {}
 
-                for metric in metrics:
-                    result[f"{field1}_{field2}"][key1][key2][metric] = getattr(
-                        row, metric
-                    )
-        else:
-            # Multi-dimensional grouping - convert to nested structure
-            result["data"] = []
+def _filter_key(filters: SkinCancerFilter) -> Tuple[Hashable, ...]:
+    """Build a cache key from filter criteria.
 
-            for row in rows:
-                item = {}
+    Args:
+        filters: Filter criteria.
 
-                for field in group_by:
-                    item[field] = getattr(row, field)
+    Returns:
+        Tuple of the filter values.
+    """
+    return (filters.data_type, filters.year, filters.sex, filters.age_group)
 
-                for metric in metrics:
-                    item[metric] = getattr(row, metric)
 
-                result["data"].append(item)
+def _tuple_getter(fields: List[str]) -> Callable[[Any], Tuple[Any, ...]]:
+    """Build a function returning the given attributes of a row as a tuple.
 
-        return result
+    Args:
+        fields: Attribute names.
+
+    Returns:
+        Function mapping a row to a tuple of its attribute values, in order.
+    """
+    if not fields:
+        return lambda row: ()
+    if len(fields) == 1:
+        getter = operator.attrgetter(fields[0])
+        return lambda row: (getter(row),)
+    return operator.attrgetter(*fields)
 
 
 skin_cancer_crud = CRUDSkinCancer(SkinCancerData)
@@ -1,8 +1,9 @@
 """Temperature record CRUD operations module."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import Row, select, tuple_
 from sqlalchemy.orm import Session
 
 from src.app.crud.base import CRUDBase
@@ -12,29 +13,135 @@ from src.app.models.temperature_record import TemperatureRecord
 class TemperatureRecordCRUD(CRUDBase[TemperatureRecord, dict, dict]):
     """CRUD operations for TemperatureRecord model."""
 
-    def get_temperature_records(self, db: Session):
-        """Getting historical temperature data"""
-        return db.execute(select(TemperatureRecord).order_by(TemperatureRecord.created_at.asc())).scalars().all()
+    def get_temperature_records(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        after_id: Optional[str] = None,
+    ) -> Sequence[Row]:
+        """Get a page of historical temperature records, oldest first.
+
+        Args:
+            db: Database session.
+            skip: Number of records to skip.
+            limit: Maximum number of records to return.
+            since: Only return records created after this time.
+            after_id: With ``since``, the ID of the last record already seen.
+                Records created at exactly ``since`` with a greater ID are
+                included too, so ``created_at``/``id`` of the last record of
+                a page form a cursor for the next one.
+
+        Returns:
+            Rows of column values. Records are only serialized, so they are not
+            loaded as ORM objects into the session.
+        """
+        stmt = select(*self.model.__table__.columns)
+        if since is not None and after_id is not None:
+            stmt = stmt.where(
+                tuple_(self.model.created_at, self.model.id) > tuple_(since, after_id)
+            )
+        elif since is not None:
+            stmt = stmt.where(self.model.created_at > since)
+        result = db.execute(
+            stmt.order_by(self.model.created_at.asc(), self.model.id.asc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.all()
 
     def get_by_location_id(
-        self, db: Session, *, location_id: str
+        self, db: Session, *, location_id: str, skip: int = 0, limit: int = 100
     ) -> List[TemperatureRecord]:
-        """Get temperature records by location ID.
+        """Get a page of temperature records by location ID, oldest first.
 
         Args:
             db: Database session.
             location_id: Location ID.
+            skip: Number of records to skip.
+            limit: Maximum number of records to return.
 
         Returns:
             List of temperature records.
         """
         result = db.execute(
-            select(self.model).where(self.model.location_id == location_id)
+            select(self.model)
+            .where(self.model.location_id == location_id)
+            .order_by(self.model.created_at.asc(), self.model.id.asc())
+            .offset(skip)
+            .limit(limit)
         )
         return result.scalars().all()
 
+    def stream_rows(self, db: Session, *, batch_size: int = 1000) -> Iterator[Row]:
+        """Iterate over all temperature records, oldest first, for exports.
+
+        Rows are fetched from the database in batches rather than loaded into
+        memory at once.
+
+        Args:
+            db: Database session.
+            batch_size: Number of rows fetched per batch.
+
+        Yields:
+            Rows of column values.
+        """
+        result = db.execute(
+            select(*self.model.__table__.columns)
+            .order_by(self.model.created_at.asc(), self.model.id.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        yield from result
+
+    @staticmethod
+    def _values_from_weather_data(
+        weather_data: dict, location_id: str
+    ) -> Dict[str, Any]:
+        """Extract temperature record column values from weather data.
+
+        Args:
+            weather_data: Weather data from OpenWeatherMap API.
+            location_id: Location ID.
+
+        Returns:
+            Column values for a new temperature record.
+        """
+        current = weather_data.get("current", {})
+
+        return {
+            "temperature": current.get("temp"),
+            "feels_like": current.get("feels_like"),
+            "humidity": current.get("humidity"),
+            "pressure": current.get("pressure"),
+            "wind_speed": current.get("wind_speed"),
+            "location_id": location_id,
+        }
+
+    def build_from_weather_data(
+        self, *, weather_data: dict, location_id: str
+    ) -> TemperatureRecord:
+        """Build an unsaved temperature record from weather data.
+
+        Args:
+            weather_data: Weather data from OpenWeatherMap API.
+            location_id: Location ID.
+
+        Returns:
+            New temperature record, not yet added to a session.
+        """
+        return TemperatureRecord(
+            **self._values_from_weather_data(weather_data, location_id)
+        )
+
     def create_from_weather_data(
-        self, db: Session, *, weather_data: dict, location_id: str
+        self,
+        db: Session,
+        *,
+        weather_data: dict,
+        location_id: str,
+        commit: bool = True,
     ) -> TemperatureRecord:
         """Create a new temperature record from weather data.
 
@@ -42,25 +149,45 @@ class TemperatureRecordCRUD(CRUDBase[TemperatureRecord, dict, dict]):
             db: Database session.
             weather_data: Weather data from OpenWeatherMap API.
             location_id: Location ID.
+            commit: Whether to commit the transaction. When False the record
+                is only flushed, leaving the caller to commit.
 
         Returns:
             Created temperature record.
         """
-        current = weather_data.get("current", {})
-        
-        db_obj = TemperatureRecord(
-            temperature=current.get("temp"),
-            feels_like=current.get("feels_like"),
-            humidity=current.get("humidity"),
-            pressure=current.get("pressure"),
-            wind_speed=current.get("wind_speed"),
-            location_id=location_id,
+        db_obj = self.build_from_weather_data(
+            weather_data=weather_data, location_id=location_id
         )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._save(db, db_obj, commit=commit)
         return db_obj
 
+    def bulk_create_from_weather_data(
+        self,
+        db: Session,
+        *,
+        items: Sequence[Tuple[dict, str]],
+        commit: bool = True,
+    ) -> None:
+        """Create temperature records for many locations in batched INSERTs.
+
+        Records are written without being loaded into the session, so their
+        generated IDs are not returned.
+
+        Args:
+            db: Database session.
+            items: Pairs of weather data from OpenWeatherMap API and the ID of
+                the location it is for.
+            commit: Whether to commit once all records are inserted.
+        """
+        self._bulk_insert(
+            db,
+            [
+                self._values_from_weather_data(weather_data, location_id)
+                for weather_data, location_id in items
+            ],
+            commit=commit,
+        )
+
 
 # Create a singleton instance
 temperature_record_crud = TemperatureRecordCRUD(TemperatureRecord)
\ No newline at end of file
@@ -1,18 +1,40 @@
 """User CRUD operations module."""
 
-from typing import Optional
+from typing import Any, Dict, Optional, Type, Union
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from src.app.core.exceptions import ConflictError
+from src.app.core.utils.cache import TTLCache
 from src.app.crud.base import CRUDBase
 from src.app.models.user import User
 from src.app.schemas.user import UserCreate, UserUpdate
 
+# Inserts to try before giving up when concurrent requests take the username
+CREATE_ATTEMPTS = 3
+
+# Returning visitors are found by primary key instead of an upsert; cached IDs
+# are checked against the loaded row, so stale entries are harmless
+USER_ID_CACHE_MAXSIZE = 10_000
+USER_ID_CACHE_TTL = 3600
+
 
 class UserCRUD(CRUDBase[User, UserCreate, UserUpdate]):
     """CRUD operations for User model."""
 
+    def __init__(self, model: Type[User]) -> None:
+        """Initialize UserCRUD.
+
+        Args:
+            model: SQLAlchemy model class.
+        """
+        super().__init__(model)
+        self._id_by_name: TTLCache[str, str] = TTLCache(
+            maxsize=USER_ID_CACHE_MAXSIZE, ttl=USER_ID_CACHE_TTL
+        )
+
     def get_by_name(self, db: Session, *, name: str) -> Optional[User]:
         """Get a user by name.
 
@@ -23,43 +45,214 @@ class UserCRUD(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User if found, None otherwise.
         """
-        result = db.execute(select(self.model).where(self.model.name == name))
-        return result.scalars().first()
+        user = self._get_cached(db, name=name)
+        if user is None:
+            # Built and cached once; name is extracted as a bound parameter
+            result = db.execute(
+                lambda_stmt(lambda: select(User).where(User.name == name))
+            )
+            user = result.scalars().first()
+            if user is not None:
+                self._id_by_name.set(name, user.id)
+        return user
 
-    def get_or_create(self, db: Session, *, name: str) -> User:
+    def get_or_create(self, db: Session, *, name: str, commit: bool = True) -> User:
         """Get a user by name or create a new one if not found.
 
+        Where the database supports it this is a single
+        ``INSERT ... ON CONFLICT (name) DO UPDATE ... RETURNING`` statement,
+        run in a savepoint. If the generated username is already taken by a
+        differently spelled name, only the savepoint is rolled back and a free
+        username is looked up, retrying up to ``CREATE_ATTEMPTS`` times if a
+        concurrent request takes it first.
+
         Args:
             db: Database session.
             name: User's name.
+            commit: Whether to commit the transaction. When False a new user
+                is only flushed, leaving the caller to commit.
 
         Returns:
             User object.
+
+        Raises:
+            ConflictError: If concurrent requests took every username tried.
+        """
+        user = self._get_cached(db, name=name)
+        if user is not None:
+            return user
+
+        insert = self._upsert_insert(db)
+        if insert is not None:
+            stmt = insert(self.model).values(
+                name=name, username=self._base_username(name)
+            )
+            # DO UPDATE rather than DO NOTHING so RETURNING yields existing rows
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[self.model.name],
+                set_={"name": stmt.excluded.name},
+            ).returning(self.model)
+            # Only the savepoint is rolled back on a username conflict, keeping
+            # any work the caller has not committed yet
+            try:
+                with db.begin_nested():
+                    user = db.scalars(
+                        stmt, execution_options={"populate_existing": True}
+                    ).one()
+            except IntegrityError:
+                pass
+            else:
+                if commit:
+                    db.commit()
+                self._id_by_name.set(name, user.id)
+                return user
+
+        # A conflicting concurrent insert of the same name or username leaves
+        # no row behind; the next attempt sees the winning row
+        for _ in range(CREATE_ATTEMPTS):
+            user = self._get_or_insert(db, name=name, commit=commit)
+            if user is not None:
+                return user
+        raise ConflictError("Could not create user", details={"name": name})
+
+    def _get_or_insert(self, db: Session, *, name: str, commit: bool) -> Optional[User]:
+        """Get a user by name or insert one with a free username.
+
+        Where the database supports it the user is inserted with
+        ``INSERT ... ON CONFLICT DO NOTHING RETURNING``, so a concurrent insert
+        of the same name or username returns no row instead of raising and
+        needs no savepoint. Otherwise the insert runs in a savepoint.
+
+        Args:
+            db: Database session.
+            name: User's name.
+            commit: Whether to commit a newly inserted user.
+
+        Returns:
+            User object, or None if a concurrent request inserted the name or
+            the chosen username first.
         """
         user = self.get_by_name(db, name=name)
-        if not user:
-            # Generate a username from the name (lowercase, no spaces)
-            username = name.lower().replace(" ", "_")
-
-            # Check if username exists, append a number if it does
-            base_username = username
-            counter = 1
-            while (
-                db.execute(select(self.model).where(self.model.username == username))
-                .scalars()
-                .first()
-            ):
-                username = f"{base_username}_{counter}"
-                counter += 1
-
-            # Create a new user
+        if user:
+            return user
+
+        username = self._free_username(db, name)
+        insert = self._upsert_insert(db)
+        if insert is not None:
+            stmt = (
+                insert(self.model)
+                .values(name=name, username=username)
+                .on_conflict_do_nothing()
+                .returning(self.model)
+            )
+            user = db.scalars(stmt).first()
+            if user is None:
+                return None
+        else:
             user = User(name=name, username=username)
-            db.add(user)
+            try:
+                with db.begin_nested():
+                    self._save(db, user, commit=False)
+            except IntegrityError:
+                return None
+        if commit:
             db.commit()
-            db.refresh(user)
+        self._id_by_name.set(name, user.id)
+        return user
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: User,
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+    ) -> User:
+        """Update a user, dropping its cached name lookup.
+
+        Args:
+            db: Database session.
+            db_obj: User to update.
+            obj_in: Input data.
+
+        Returns:
+            Updated user.
+        """
+        self._id_by_name.pop(db_obj.name)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id: Any) -> Optional[User]:
+        """Remove a user, dropping its cached name lookup.
 
+        Args:
+            db: Database session.
+            id: User ID.
+
+        Returns:
+            Removed user if found, None otherwise.
+        """
+        user = super().remove(db, id=id)
+        if user is not None:
+            self._id_by_name.pop(user.name)
         return user
 
+    def _get_cached(self, db: Session, *, name: str) -> Optional[User]:
+        """Get a user through the cached name to ID mapping.
+
+        Args:
+            db: Database session.
+            name: User's name.
+
+        Returns:
+            User if the name is cached and still belongs to that user, None
+            otherwise.
+        """
+        user_id = self._id_by_name.get(name)
+        if user_id is None:
+            return None
+        user = db.get(self.model, user_id)
+        if user is None or user.name != name:
+            self._id_by_name.pop(name)
+            return None
+        return user
+
+    def _free_username(self, db: Session, name: str) -> str:
+        """Find an unused username for a name with a single query.
+
+        Args:
+            db: Database session.
+            name: User's name.
+
+        Returns:
+            The base username if it is free, otherwise the base username with
+            the lowest free numeric suffix.
+        """
+        base_username = self._base_username(name)
+        taken = set(
+            db.scalars(
+                select(self.model.username).where(
+                    self.model.username.startswith(base_username, autoescape=True)
+                )
+            )
+        )
+        username = base_username
+        counter = 1
+        while username in taken:
+            username = f"{base_username}_{counter}"
+            counter += 1
+        return username
+
+    @staticmethod
+    def _base_username(name: str) -> str:
+        """Generate a username from a name (lowercase, no spaces).
+
+        Args:
+            name: User's name.
+
+        Returns:
+            Username before any de-duplication suffix.
+        """
+        return name.lower().replace(" ", "_")
+
 
 # Create a singleton instance
 user_crud = UserCRUD(User)
@@ -1,8 +1,9 @@
 """UV record CRUD operations module."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import Row, select, tuple_
 from sqlalchemy.orm import Session
 
 from src.app.crud.base import CRUDBase
@@ -11,27 +12,131 @@ from src.app.models.uv_record import UVRecord
 
 class UVRecordCRUD(CRUDBase[UVRecord, dict, dict]):
     """CRUD operations for UVRecord model."""
-    def get_uv_records(self, db: Session):
-        """Get all historical UV index records"""
-        return db.execute(select(UVRecord).order_by(UVRecord.created_at.asc())).scalars().all()
+    def get_uv_records(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        after_id: Optional[str] = None,
+    ) -> Sequence[Row]:
+        """Get a page of historical UV index records, oldest first.
 
-    def get_by_location_id(self, db: Session, *, location_id: str) -> List[UVRecord]:
-        """Get UV records by location ID.
+        Args:
+            db: Database session.
+            skip: Number of records to skip.
+            limit: Maximum number of records to return.
+            since: Only return records created after this time.
+            after_id: With ``since``, the ID of the last record already seen.
+                Records created at exactly ``since`` with a greater ID are
+                included too, so ``created_at``/``id`` of the last record of
+                a page form a cursor for the next one.
+
+        Returns:
+            Rows of column values. Records are only serialized, so they are not
+            loaded as ORM objects into the session.
+        """
+        stmt = select(*self.model.__table__.columns)
+        if since is not None and after_id is not None:
+            stmt = stmt.where(
+                tuple_(self.model.created_at, self.model.id) > tuple_(since, after_id)
+            )
+        elif since is not None:
+            stmt = stmt.where(self.model.created_at > since)
+        result = db.execute(
+            stmt.order_by(self.model.created_at.asc(), self.model.id.asc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.all()
+
+    def get_by_location_id(
+        self, db: Session, *, location_id: str, skip: int = 0, limit: int = 100
+    ) -> List[UVRecord]:
+        """Get a page of UV records by location ID, oldest first.
 
         Args:
             db: Database session.
             location_id: Location ID.
+            skip: Number of records to skip.
+            limit: Maximum number of records to return.
 
         Returns:
             List of UV records.
         """
         result = db.execute(
-            select(self.model).where(self.model.location_id == location_id)
+            select(self.model)
+            .where(self.model.location_id == location_id)
+            .order_by(self.model.created_at.asc(), self.model.id.asc())
+            .offset(skip)
+            .limit(limit)
         )
         return result.scalars().all()
 
+    def stream_rows(self, db: Session, *, batch_size: int = 1000) -> Iterator[Row]:
+        """Iterate over all UV records, oldest first, for exports.
+
+        Rows are fetched from the database in batches rather than loaded into
+        memory at once.
+
+        Args:
+            db: Database session.
+            batch_size: Number of rows fetched per batch.
+
+        Yields:
+            Rows of column values.
+        """
+        result = db.execute(
+            select(*self.model.__table__.columns)
+            .order_by(self.model.created_at.asc(), self.model.id.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        yield from result
+
+    @staticmethod
+    def _values_from_weather_data(
+        weather_data: dict, location_id: str
+    ) -> Dict[str, Any]:
+        """Extract UV record column values from weather data.
+
+        Args:
+            weather_data: Weather data from OpenWeatherMap API.
+            location_id: Location ID.
+
+        Returns:
+            Column values for a new UV record.
+        """
+        current = weather_data.get("current", {})
+
+        return {
+            "uv_index": current.get("uvi"),
+            "clouds": current.get("clouds"),
+            "visibility": current.get("visibility"),
+            "location_id": location_id,
+        }
+
+    def build_from_weather_data(
+        self, *, weather_data: dict, location_id: str
+    ) -> UVRecord:
+        """Build an unsaved UV record from weather data.
+
+        Args:
+            weather_data: Weather data from OpenWeatherMap API.
+            location_id: Location ID.
+
+        Returns:
+            New UV record, not yet added to a session.
+        """
+        return UVRecord(**self._values_from_weather_data(weather_data, location_id))
+
     def create_from_weather_data(
-        self, db: Session, *, weather_data: dict, location_id: str
+        self,
+        db: Session,
+        *,
+        weather_data: dict,
+        location_id: str,
+        commit: bool = True,
     ) -> UVRecord:
         """Create a new UV record from weather data.
 
@@ -39,23 +144,45 @@ class UVRecordCRUD(CRUDBase[UVRecord, dict, dict]):
             db: Database session.
             weather_data: Weather data from OpenWeatherMap API.
             location_id: Location ID.
+            commit: Whether to commit the transaction. When False the record
+                is only flushed, leaving the caller to commit.
 
         Returns:
             Created UV record.
         """
-        current = weather_data.get("current", {})
-        
-        db_obj = UVRecord(
-            uv_index=current.get("uvi"),
-            clouds=current.get("clouds"),
-            visibility=current.get("visibility"),
-            location_id=location_id,
+        db_obj = self.build_from_weather_data(
+            weather_data=weather_data, location_id=location_id
         )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._save(db, db_obj, commit=commit)
         return db_obj
 
+    def bulk_create_from_weather_data(
+        self,
+        db: Session,
+        *,
+        items: Sequence[Tuple[dict, str]],
+        commit: bool = True,
+    ) -> None:
+        """Create UV records for many locations in batched INSERTs.
+
+        Records are written without being loaded into the session, so their
+        generated IDs are not returned.
+
+        Args:
+            db: Database session.
+            items: Pairs of weather data from OpenWeatherMap API and the ID of
+                the location it is for.
+            commit: Whether to commit once all records are inserted.
+        """
+        self._bulk_insert(
+            db,
+            [
+                self._values_from_weather_data(weather_data, location_id)
+                for weather_data, location_id in items
+            ],
+            commit=commit,
+        )
+
 
 # Create a singleton instance
 uv_record_crud = UVRecordCRUD(UVRecord)
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Float, ForeignKey, String
+from sqlalchemy import Float, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.app.core.db.base_class import Base, TimestampMixin, UUIDMixin
@@ -30,6 +30,10 @@ class Location(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "locations"
+    __table_args__ = (
+        # Conflict target for upserting locations by coordinates
+        Index("ix_locations_coordinates", "latitude", "longitude", unique=True),
+    )
 
     latitude: Mapped[float] = mapped_column(Float, nullable=False)
     longitude: Mapped[float] = mapped_column(Float, nullable=False)
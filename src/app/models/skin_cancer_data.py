@@ -1,6 +1,6 @@
 """Skin cancer data model module."""
 
-from sqlalchemy import Integer, String
+from sqlalchemy import Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.app.core.db.base_class import Base, TimestampMixin, UUIDMixin
@@ -22,10 +22,25 @@ class SkinCancerData(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "skin_cancer_data"
+    __table_args__ = (
+        # Covers the filtered queries (cancer_group is always filtered on) and
+        # lets count aggregations be answered from the index alone. Queries on
+        # data_type or sex always include cancer_group, so those columns need
+        # no index of their own
+        Index(
+            "ix_skin_cancer_filter",
+            "cancer_group",
+            "data_type",
+            "year",
+            "sex",
+            "age_group",
+            postgresql_include=["count"],
+        ),
+    )
 
-    data_type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    cancer_group: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    data_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    cancer_group: Mapped[str] = mapped_column(String(100), nullable=False)
     year: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
-    sex: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
+    sex: Mapped[str] = mapped_column(String(10), nullable=False)
     age_group: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
     count: Mapped[int] = mapped_column(Integer, nullable=False)
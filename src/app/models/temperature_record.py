@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Float, ForeignKey
+from sqlalchemy import Float, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.app.core.db.base_class import Base, TimestampMixin, UUIDMixin
@@ -27,6 +27,10 @@ class TemperatureRecord(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "temperature_records"
+    __table_args__ = (
+        # Serves the oldest-first history listing and its ``since`` filter
+        Index("ix_temperature_records_created_at_id", "created_at", "id"),
+    )
 
     temperature: Mapped[float] = mapped_column(Float, nullable=False)
     feels_like: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
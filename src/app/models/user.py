@@ -16,7 +16,7 @@ class User(Base, UUIDMixin, TimestampMixin):
 
     Attributes:
         id: User ID (UUID).
-        name: User's full name.
+        name: User's full name (unique).
         username: Unique username for the user.
         created_at: When the user was created.
         updated_at: When the user was last updated.
@@ -24,7 +24,9 @@ class User(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "users"
 
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(
+        String(255), unique=True, index=True, nullable=False
+    )
     username: Mapped[str] = mapped_column(
         String(50), unique=True, index=True, nullable=False
     )
@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Float, ForeignKey, Integer
+from sqlalchemy import Float, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.app.core.db.base_class import Base, TimestampMixin, UUIDMixin
@@ -25,6 +25,10 @@ class UVRecord(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "uv_records"
+    __table_args__ = (
+        # Serves the oldest-first history listing and its ``since`` filter
+        Index("ix_uv_records_created_at_id", "created_at", "id"),
+    )
 
     uv_index: Mapped[float] = mapped_column(Float, nullable=False)
     clouds: Mapped[Optional[int]] = mapped_column(
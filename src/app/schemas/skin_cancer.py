@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DataTypeEnum(str, Enum):
@@ -85,10 +85,7 @@ class SkinCancerData(BaseModel):
     count: int
     age_specific_rate: Optional[float] = None
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SkinCancerDataResponse(BaseModel):
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class UserBase(BaseModel):
@@ -50,14 +50,12 @@ class UserInDBBase(UserBase):
 
     id: int
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserResponse(UserInDBBase):
     """User response schema."""
+
     pass
 
 
@@ -68,4 +66,4 @@ class UserInDB(UserInDBBase):
         hashed_password: Hashed password.
     """
 
-    hashed_password: str
\ No newline at end of file
+    hashed_password: str
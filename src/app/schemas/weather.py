@@ -4,6 +4,25 @@ from typing import List, Literal
 
 from pydantic import BaseModel, Field
 
+# Accepted values for the BoM map query parameters
+MapPeriod = Literal[
+    "annual",
+    "jan",
+    "feb",
+    "mar",
+    "apr",
+    "may",
+    "jun",
+    "jul",
+    "aug",
+    "sep",
+    "oct",
+    "nov",
+    "dec",
+]
+TemperatureType = Literal["mean", "max", "min"]
+Region = Literal["aus", "ns", "nt", "qd", "sa", "ta", "vc", "wa"]
+
 
 class WeatherRequest(BaseModel):
     """Request schema for weather data by coordinates.
@@ -6,9 +6,16 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from src.app.core.config import settings
+from src.app.core.http_client import http_client_manager
+from src.app.core.utils.cache import TTLCache
+from src.app.core.utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Autocomplete results are stable for hours and inputs repeat heavily across users
+PREDICTIONS_CACHE_MAXSIZE = 10_000
+PREDICTIONS_CACHE_TTL = 3600
+
 # Check if Google Maps API key is configured
 if not hasattr(settings, "GOOGLE_MAPS_API_KEY"):
     logger.warning(
@@ -36,9 +43,16 @@ class GoogleMapsService:
             "northeast": {"lat": -10.6681857235, "lng": 153.569469029},
         }
 
+        self._predictions_cache: TTLCache[str, List[Dict[str, Any]]] = TTLCache(
+            maxsize=PREDICTIONS_CACHE_MAXSIZE, ttl=PREDICTIONS_CACHE_TTL
+        )
+        self._geocode_calls: SingleFlight[str, Dict[str, Any]] = SingleFlight()
+
     async def get_address_predictions(self, input_text: str) -> List[Dict[str, Any]]:
         """Get address predictions from Google Places Autocomplete API.
 
+        Results are cached in process, keyed on the normalized input text.
+
         Args:
             input_text: The text to get predictions for.
 
@@ -51,6 +65,11 @@ class GoogleMapsService:
         if not self.api_key:
             raise ValueError("Google Maps API key is not configured")
 
+        cache_key = " ".join(input_text.lower().split())
+        cached = self._predictions_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         params = {
             "input": input_text,
             "key": self.api_key,
@@ -59,30 +78,31 @@ class GoogleMapsService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.places_autocomplete_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                if data["status"] != "OK" and data["status"] != "ZERO_RESULTS":
-                    logger.error(f"Google Places API error: {data['status']}")
-                    raise ValueError(f"Google Places API error: {data['status']}")
-
-                predictions = []
-                for prediction in data.get("predictions", []):
-                    predictions.append(
-                        {
-                            "place_id": prediction.get("place_id"),
-                            "description": prediction.get("description"),
-                            "structured_formatting": prediction.get(
-                                "structured_formatting", {}
-                            ),
-                        }
-                    )
-
-                return predictions
+            client = http_client_manager.client
+            response = await client.get(self.places_autocomplete_url, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            if data["status"] != "OK" and data["status"] != "ZERO_RESULTS":
+                logger.error("Google Places API error: %s", data["status"])
+                raise ValueError(f"Google Places API error: {data['status']}")
+
+            predictions = []
+            for prediction in data.get("predictions", []):
+                predictions.append(
+                    {
+                        "place_id": prediction.get("place_id"),
+                        "description": prediction.get("description"),
+                        "structured_formatting": prediction.get(
+                            "structured_formatting", {}
+                        ),
+                    }
+                )
+
+            self._predictions_cache.set(cache_key, predictions)
+            return predictions
         except httpx.HTTPError as e:
-            logger.error(f"Error fetching address predictions: {e}")
+            logger.error("Error fetching address predictions: %s", e)
             raise ValueError(f"Error fetching address predictions: {str(e)}")
 
     async def get_place_details(self, place_id: str) -> Dict[str, Any]:
@@ -107,66 +127,68 @@ class GoogleMapsService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.places_details_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                if data["status"] != "OK":
-                    logger.error(f"Google Places API error: {data['status']}")
-                    raise ValueError(f"Google Places API error: {data['status']}")
-
-                result = data.get("result", {})
-
-                # Check if the place is in Australia
-                is_in_australia = False
-                for component in result.get("address_components", []):
-                    if (
-                        "country" in component.get("types", [])
-                        and component.get("short_name") == "AU"
-                    ):
-                        is_in_australia = True
-                        break
-
-                if not is_in_australia:
-                    raise ValueError("Location is not in Australia")
-
-                # Extract location details
-                geometry = result.get("geometry", {})
-                location = geometry.get("location", {})
-
-                # Extract city and country from address components
-                city = "Unknown"
-                country = "Unknown"
-                for component in result.get("address_components", []):
-                    if "locality" in component.get("types", []):
-                        city = component.get("long_name")
-                    elif (
-                        "administrative_area_level_1" in component.get("types", [])
-                        and not city
-                        or city == "Unknown"
-                    ):
-                        # Use administrative area if locality is not available
-                        city = component.get("long_name")
-                    elif "country" in component.get("types", []):
-                        country = component.get("long_name")
-
-                return {
-                    "place_id": place_id,
-                    "formatted_address": result.get("formatted_address"),
-                    "name": result.get("name"),
-                    "lat": location.get("lat"),
-                    "lng": location.get("lng"),
-                    "city": city,
-                    "country": country,
-                }
+            client = http_client_manager.client
+            response = await client.get(self.places_details_url, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            if data["status"] != "OK":
+                logger.error("Google Places API error: %s", data["status"])
+                raise ValueError(f"Google Places API error: {data['status']}")
+
+            result = data.get("result", {})
+
+            # Check if the place is in Australia
+            is_in_australia = False
+            for component in result.get("address_components", []):
+                if (
+                    "country" in component.get("types", [])
+                    and component.get("short_name") == "AU"
+                ):
+                    is_in_australia = True
+                    break
+
+            if not is_in_australia:
+                raise ValueError("Location is not in Australia")
+
+            # Extract location details
+            geometry = result.get("geometry", {})
+            location = geometry.get("location", {})
+
+            # Extract city and country from address components
+            city = "Unknown"
+            country = "Unknown"
+            for component in result.get("address_components", []):
+                if "locality" in component.get("types", []):
+                    city = component.get("long_name")
+                elif (
+                    "administrative_area_level_1" in component.get("types", [])
+                    and not city
+                    or city == "Unknown"
+                ):
+                    # Use administrative area if locality is not available
+                    city = component.get("long_name")
+                elif "country" in component.get("types", []):
+                    country = component.get("long_name")
+
+            return {
+                "place_id": place_id,
+                "formatted_address": result.get("formatted_address"),
+                "name": result.get("name"),
+                "lat": location.get("lat"),
+                "lng": location.get("lng"),
+                "city": city,
+                "country": country,
+            }
         except httpx.HTTPError as e:
-            logger.error(f"Error fetching place details: {e}")
+            logger.error("Error fetching place details: %s", e)
             raise ValueError(f"Error fetching place details: {str(e)}")
 
     async def geocode_address(self, address: str) -> Dict[str, Any]:
         """Geocode an address to get coordinates.
 
+        Concurrent requests for the same address share a single upstream call.
+
         Args:
             address: The address to geocode.
 
@@ -180,6 +202,23 @@ class GoogleMapsService:
         if not self.api_key:
             raise ValueError("Google Maps API key is not configured")
 
+        return await self._geocode_calls.do(
+            address.strip().lower(), lambda: self._geocode_address(address)
+        )
+
+    async def _geocode_address(self, address: str) -> Dict[str, Any]:
+        """Call the Google Geocoding API for an address.
+
+        Args:
+            address: The address to geocode.
+
+        Returns:
+            Geocoding result with coordinates.
+
+        Raises:
+            ValueError: If there's an error with the request or if the location
+                is not in Australia.
+        """
         params = {
             "address": address,
             "key": self.api_key,
@@ -187,59 +226,59 @@ class GoogleMapsService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.geocode_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                if data["status"] != "OK":
-                    logger.error(f"Google Geocoding API error: {data['status']}")
-                    raise ValueError(f"Google Geocoding API error: {data['status']}")
-
-                result = data.get("results", [])[0]
-
-                # Check if the place is in Australia
-                is_in_australia = False
-                for component in result.get("address_components", []):
-                    if (
-                        "country" in component.get("types", [])
-                        and component.get("short_name") == "AU"
-                    ):
-                        is_in_australia = True
-                        break
-
-                if not is_in_australia:
-                    raise ValueError("Location is not in Australia")
-
-                # Extract location details
-                geometry = result.get("geometry", {})
-                location = geometry.get("location", {})
-
-                # Extract city and country from address components
-                city = "Unknown"
-                country = "Unknown"
-                for component in result.get("address_components", []):
-                    if "locality" in component.get("types", []):
-                        city = component.get("long_name")
-                    elif (
-                        "administrative_area_level_1" in component.get("types", [])
-                        and not city
-                        or city == "Unknown"
-                    ):
-                        # Use administrative area if locality is not available
-                        city = component.get("long_name")
-                    elif "country" in component.get("types", []):
-                        country = component.get("long_name")
-
-                return {
-                    "formatted_address": result.get("formatted_address"),
-                    "lat": location.get("lat"),
-                    "lng": location.get("lng"),
-                    "city": city,
-                    "country": country,
-                }
+            client = http_client_manager.client
+            response = await client.get(self.geocode_url, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            if data["status"] != "OK":
+                logger.error("Google Geocoding API error: %s", data["status"])
+                raise ValueError(f"Google Geocoding API error: {data['status']}")
+
+            result = data.get("results", [])[0]
+
+            # Check if the place is in Australia
+            is_in_australia = False
+            for component in result.get("address_components", []):
+                if (
+                    "country" in component.get("types", [])
+                    and component.get("short_name") == "AU"
+                ):
+                    is_in_australia = True
+                    break
+
+            if not is_in_australia:
+                raise ValueError("Location is not in Australia")
+
+            # Extract location details
+            geometry = result.get("geometry", {})
+            location = geometry.get("location", {})
+
+            # Extract city and country from address components
+            city = "Unknown"
+            country = "Unknown"
+            for component in result.get("address_components", []):
+                if "locality" in component.get("types", []):
+                    city = component.get("long_name")
+                elif (
+                    "administrative_area_level_1" in component.get("types", [])
+                    and not city
+                    or city == "Unknown"
+                ):
+                    # Use administrative area if locality is not available
+                    city = component.get("long_name")
+                elif "country" in component.get("types", []):
+                    country = component.get("long_name")
+
+            return {
+                "formatted_address": result.get("formatted_address"),
+                "lat": location.get("lat"),
+                "lng": location.get("lng"),
+                "city": city,
+                "country": country,
+            }
         except httpx.HTTPError as e:
-            logger.error(f"Error geocoding address: {e}")
+            logger.error("Error geocoding address: %s", e)
             raise ValueError(f"Error geocoding address: {str(e)}")
 
     async def reverse_geocode(self, lat: float, lng: float) -> Dict[str, Any]:
@@ -266,63 +305,61 @@ class GoogleMapsService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.geocode_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                if data["status"] != "OK" and data["status"] != "ZERO_RESULTS":
-                    logger.error(
-                        f"Google Reverse Geocoding API error: {data['status']}"
-                    )
-                    raise ValueError(
-                        f"Google Reverse Geocoding API error: {data['status']}"
-                    )
-
-                if not data.get("results"):
-                    return {"lat": lat, "lng": lng}
-
-                result = data.get("results", [])[0]
-
-                # Check if the place is in Australia
-                is_in_australia = False
-                for component in result.get("address_components", []):
-                    if (
-                        "country" in component.get("types", [])
-                        and component.get("short_name") == "AU"
-                    ):
-                        is_in_australia = True
-                        break
-
-                if not is_in_australia:
-                    raise ValueError("Location is not in Australia")
-
-                # Extract city and country from address components
-                city = "Unknown"
-                country = "Unknown"
-                for component in result.get("address_components", []):
-                    if "locality" in component.get("types", []):
-                        city = component.get("long_name")
-                    elif (
-                        "administrative_area_level_1" in component.get("types", [])
-                        and not city
-                        or city == "Unknown"
-                    ):
-                        # Use administrative area if locality is not available
-                        city = component.get("long_name")
-                    elif "country" in component.get("types", []):
-                        country = component.get("long_name")
-
-                return {
-                    "formatted_address": result.get("formatted_address"),
-                    "name": result.get("formatted_address"),
-                    "lat": lat,
-                    "lng": lng,
-                    "city": city,
-                    "country": country,
-                }
+            client = http_client_manager.client
+            response = await client.get(self.geocode_url, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            if data["status"] != "OK" and data["status"] != "ZERO_RESULTS":
+                logger.error("Google Reverse Geocoding API error: %s", data["status"])
+                raise ValueError(
+                    f"Google Reverse Geocoding API error: {data['status']}"
+                )
+
+            if not data.get("results"):
+                return {"lat": lat, "lng": lng}
+
+            result = data.get("results", [])[0]
+
+            # Check if the place is in Australia
+            is_in_australia = False
+            for component in result.get("address_components", []):
+                if (
+                    "country" in component.get("types", [])
+                    and component.get("short_name") == "AU"
+                ):
+                    is_in_australia = True
+                    break
+
+            if not is_in_australia:
+                raise ValueError("Location is not in Australia")
+
+            # Extract city and country from address components
+            city = "Unknown"
+            country = "Unknown"
+            for component in result.get("address_components", []):
+                if "locality" in component.get("types", []):
+                    city = component.get("long_name")
+                elif (
+                    "administrative_area_level_1" in component.get("types", [])
+                    and not city
+                    or city == "Unknown"
+                ):
+                    # Use administrative area if locality is not available
+                    city = component.get("long_name")
+                elif "country" in component.get("types", []):
+                    country = component.get("long_name")
+
+            return {
+                "formatted_address": result.get("formatted_address"),
+                "name": result.get("formatted_address"),
+                "lat": lat,
+                "lng": lng,
+                "city": city,
+                "country": country,
+            }
         except httpx.HTTPError as e:
-            logger.error(f"Error reverse geocoding: {e}")
+            logger.error("Error reverse geocoding: %s", e)
             raise ValueError(f"Error reverse geocoding: {str(e)}")
 
 
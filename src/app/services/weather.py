@@ -2,15 +2,37 @@
 
 import logging
 from datetime import datetime
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
 import httpx
 
 from src.app.core.config import settings
+from src.app.core.http_client import http_client_manager
+from src.app.core.utils.cache import TTLCache
+from src.app.core.utils.singleflight import SingleFlight
 from src.app.services.google_maps import google_maps_service
 
 logger = logging.getLogger(__name__)
 
+# Current conditions are reused for nearby coordinates (~100m) for 15 minutes
+WEATHER_CACHE_MAXSIZE = 10_000
+WEATHER_CACHE_TTL = 900
+WEATHER_CACHE_PRECISION = 3
+
+# BoM map file name parts for each accepted query parameter value
+_MONTHS = "jan feb mar apr may jun jul aug sep oct nov dec".split()
+UV_PERIOD_FILES: Mapping[str, str] = MappingProxyType(
+    {"annual": "uv-an.png", **{month: f"uv-{month}.png" for month in _MONTHS}}
+)
+TEMP_PERIOD_FILES: Mapping[str, str] = MappingProxyType(
+    {"annual": "an.png", **{month: f"{month}.png" for month in _MONTHS}}
+)
+TEMP_TYPE_PATHS: Mapping[str, str] = MappingProxyType(
+    {"mean": "mean", "max": "mxt", "min": "mnt"}
+)
+TEMP_REGIONS = frozenset(("aus", "ns", "nt", "qd", "sa", "ta", "vc", "wa"))
+
 # Add OpenWeatherMap API key to settings
 if not hasattr(settings, "OPENWEATHERMAP_API_KEY"):
     logger.warning(
@@ -26,15 +48,25 @@ class WeatherService:
         self.api_key = getattr(settings, "OPENWEATHERMAP_API_KEY", None)
         self.base_url = "https://api.openweathermap.org/data/3.0/onecall"
         self.bom_uv_base_url = (
-            "http://www.bom.gov.au/climate/maps/averages/uv-index/maps"
+            "https://www.bom.gov.au/climate/maps/averages/uv-index/maps"
         )
         self.bom_temp_base_url = (
-            "http://www.bom.gov.au/climate/maps/averages/temperature/maps"
+            "https://www.bom.gov.au/climate/maps/averages/temperature/maps"
+        )
+        self._weather_cache: TTLCache[Tuple[float, float], Dict[str, Any]] = TTLCache(
+            maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL
         )
+        self._weather_calls: SingleFlight[
+            Tuple[float, float], Dict[str, Any]
+        ] = SingleFlight()
 
     async def get_weather_data(self, lat: float, lon: float) -> Dict[str, Any]:
         """Get weather data from OpenWeatherMap API.
 
+        Results are cached in process for coordinates rounded to
+        ``WEATHER_CACHE_PRECISION`` decimal places, and concurrent cache misses
+        for the same rounded coordinates share a single upstream request.
+
         Args:
             lat: Latitude of the location.
             lon: Longitude of the location.
@@ -49,6 +81,39 @@ class WeatherService:
         if not self.api_key:
             raise ValueError("OpenWeatherMap API key is not configured")
 
+        cache_key = (
+            round(lat, WEATHER_CACHE_PRECISION),
+            round(lon, WEATHER_CACHE_PRECISION),
+        )
+        weather_data = self._weather_cache.get(cache_key)
+        if weather_data is None:
+
+            async def fetch() -> Dict[str, Any]:
+                data = await self._fetch_weather_data(lat, lon)
+                self._weather_cache.set(cache_key, data)
+                return data
+
+            weather_data = await self._weather_calls.do(cache_key, fetch)
+
+        # Report the requested coordinates, not those of the cached request
+        return {
+            **weather_data,
+            "location": {**weather_data["location"], "lat": lat, "lon": lon},
+        }
+
+    async def _fetch_weather_data(self, lat: float, lon: float) -> Dict[str, Any]:
+        """Fetch weather data from OpenWeatherMap API.
+
+        Args:
+            lat: Latitude of the location.
+            lon: Longitude of the location.
+
+        Returns:
+            Weather data from OpenWeatherMap API.
+
+        Raises:
+            ValueError: If there's an error with the HTTP request.
+        """
         params = {
             "lat": lat,
             "lon": lon,
@@ -58,40 +123,40 @@ class WeatherService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                # Get location information using Google Maps service
-                try:
-                    location_info = await google_maps_service.reverse_geocode(lat, lon)
-                except Exception as e:
-                    logger.warning(f"Error getting location info from Google Maps: {e}")
-                    # Fallback to basic location info if Google Maps fails
-                    location_info = {
-                        "lat": lat,
-                        "lng": lon,
-                        "city": "Unknown",
-                        "country": "Unknown",
-                        "formatted_address": "Unknown",
-                    }
-
-                # Format the response
-                return {
-                    "location": {
-                        "name": location_info.get("formatted_address", "Unknown"),
-                        "address": location_info.get("formatted_address", "Unknown"),
-                        "lat": lat,
-                        "lon": lon,
-                        "country": location_info.get("country", "Unknown"),
-                        "city": location_info.get("city", "Unknown"),
-                    },
-                    "current": data["current"],
-                    "timestamp": datetime.now().isoformat(),
+            client = http_client_manager.client
+            response = await client.get(self.base_url, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            # Get location information using Google Maps service
+            try:
+                location_info = await google_maps_service.reverse_geocode(lat, lon)
+            except Exception as e:
+                logger.warning("Error getting location info from Google Maps: %s", e)
+                # Fallback to basic location info if Google Maps fails
+                location_info = {
+                    "lat": lat,
+                    "lng": lon,
+                    "city": "Unknown",
+                    "country": "Unknown",
+                    "formatted_address": "Unknown",
                 }
+
+            # Format the response
+            return {
+                "location": {
+                    "name": location_info.get("formatted_address", "Unknown"),
+                    "address": location_info.get("formatted_address", "Unknown"),
+                    "lat": lat,
+                    "lon": lon,
+                    "country": location_info.get("country", "Unknown"),
+                    "city": location_info.get("city", "Unknown"),
+                },
+                "current": data["current"],
+                "timestamp": datetime.now().isoformat(),
+            }
         except httpx.HTTPError as e:
-            logger.error(f"Error fetching weather data: {e}")
+            logger.error("Error fetching weather data: %s", e)
             raise ValueError(f"Error fetching weather data: {str(e)}")
 
     def get_uv_index_heatmap_url(self, period: str) -> str:
@@ -106,30 +171,13 @@ class WeatherService:
         Raises:
             ValueError: If the period is invalid.
         """
-        # Map period to URL suffix
-        period_map = {
-            "annual": "uv-an.png",
-            "jan": "uv-jan.png",
-            "feb": "uv-feb.png",
-            "mar": "uv-mar.png",
-            "apr": "uv-apr.png",
-            "may": "uv-may.png",
-            "jun": "uv-jun.png",
-            "jul": "uv-jul.png",
-            "aug": "uv-aug.png",
-            "sep": "uv-sep.png",
-            "oct": "uv-oct.png",
-            "nov": "uv-nov.png",
-            "dec": "uv-dec.png",
-        }
-
-        if period.lower() not in period_map:
+        if period.lower() not in UV_PERIOD_FILES:
             raise ValueError(
                 f"Invalid period: {period}. Must be 'annual' or a three-letter month abbreviation."
             )
 
         # Construct the URL
-        return f"{self.bom_uv_base_url}/{period_map[period.lower()]}"
+        return f"{self.bom_uv_base_url}/{UV_PERIOD_FILES[period.lower()]}"
 
     def get_temperature_map_url(self, temp_type: str, region: str, period: str) -> str:
         """Get URL for temperature map from Australian Bureau of Meteorology.
@@ -145,48 +193,26 @@ class WeatherService:
         Raises:
             ValueError: If any of the parameters are invalid.
         """
-        # Map temperature type to URL path
-        temp_type_map = {
-            "mean": "mean",
-            "max": "mxt",
-            "min": "mnt",
-        }
-
-        # Map period to URL suffix
-        period_map = {
-            "annual": "an.png",
-            "jan": "jan.png",
-            "feb": "feb.png",
-            "mar": "mar.png",
-            "apr": "apr.png",
-            "may": "may.png",
-            "jun": "jun.png",
-            "jul": "jul.png",
-            "aug": "aug.png",
-            "sep": "sep.png",
-            "oct": "oct.png",
-            "nov": "nov.png",
-            "dec": "dec.png",
-        }
-
         # Validate parameters
-        if temp_type.lower() not in temp_type_map:
+        if temp_type.lower() not in TEMP_TYPE_PATHS:
             raise ValueError(
                 f"Invalid temperature type: {temp_type}. Must be 'mean', 'max', or 'min'."
             )
 
-        if region.lower() not in ["aus", "ns", "nt", "qd", "sa", "ta", "vc", "wa"]:
+        if region.lower() not in TEMP_REGIONS:
             raise ValueError(
                 f"Invalid region: {region}. Must be 'aus', 'ns', 'nt', 'qd', 'sa', 'ta', 'vc', or 'wa'."
             )
 
-        if period.lower() not in period_map:
+        if period.lower() not in TEMP_PERIOD_FILES:
             raise ValueError(
                 f"Invalid period: {period}. Must be 'annual' or a three-letter month abbreviation."
             )
 
         # Construct the URL
-        return f"{self.bom_temp_base_url}/{temp_type_map[temp_type.lower()]}/{region.lower()}/{temp_type_map[temp_type.lower()]}{region.lower()}{period_map[period.lower()]}"
+        path = TEMP_TYPE_PATHS[temp_type.lower()]
+        region = region.lower()
+        return f"{self.bom_temp_base_url}/{path}/{region}/{path}{region}{TEMP_PERIOD_FILES[period.lower()]}"
 
 
 # Create a singleton instance
@@ -0,0 +1,43 @@
+"""Route declaration tests."""
+
+import asyncio
+from typing import Iterator
+
+from fastapi import FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+
+from src.app.core.db.session import get_db
+
+
+def _dependency_calls(dependant: Dependant) -> Iterator[object]:
+    """Yield every dependency callable of a route, recursively.
+
+    Args:
+        dependant: Route or dependency dependant.
+
+    Yields:
+        Dependency callables.
+    """
+    for sub_dependant in dependant.dependencies:
+        yield sub_dependant.call
+        yield from _dependency_calls(sub_dependant)
+
+
+def test_database_routes_are_sync(app: FastAPI) -> None:
+    """Test that routes using the sync session are not coroutines.
+
+    FastAPI runs plain ``def`` endpoints in its threadpool; an ``async def``
+    endpoint using the session would block the event loop on every query.
+
+    Args:
+        app: Test FastAPI application.
+    """
+    blocking_routes = [
+        route.path
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and asyncio.iscoroutinefunction(route.endpoint)
+        and get_db in _dependency_calls(route.dependant)
+    ]
+    assert blocking_routes == []
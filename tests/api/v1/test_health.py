@@ -1,7 +1,14 @@
 """Health check endpoint tests."""
 
+from unittest.mock import MagicMock
+
 import pytest
+from fastapi import FastAPI
 from httpx import AsyncClient
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.app.core.db.session import db_manager, get_db
 
 
 @pytest.mark.asyncio
@@ -11,11 +18,67 @@ async def test_health_check(client: AsyncClient) -> None:
     Args:
         client: Test client.
     """
-    response = await client.get("/api/v1/health")
+    response = await client.get("/api/v1/health/")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
     assert "version" in data
     assert "environment" in data
     assert "dependencies" in data
-    assert "database" in data["dependencies"]
\ No newline at end of file
+    assert "database" in data["dependencies"]
+
+
+@pytest.mark.asyncio
+async def test_ping(client: AsyncClient) -> None:
+    """Test ping endpoint.
+
+    Args:
+        client: Test client.
+    """
+    response = await client.get("/api/v1/health/ping")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert "version" in data
+    assert "environment" in data
+    assert "timestamp" in data
+
+
+@pytest.mark.asyncio
+async def test_health_check_database_unavailable(
+    app: FastAPI, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that routes needing the database fail fast with 503 when it is down.
+
+    Args:
+        app: Test FastAPI application.
+        client: Test client.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    app.dependency_overrides.clear()
+    monkeypatch.setattr(db_manager, "_initialized", False)
+    monkeypatch.setattr(db_manager, "initialize", lambda retry=True: False)
+
+    response = await client.get("/api/v1/health/")
+    assert response.status_code == 503
+    assert response.json()["error"]["message"] == "Database is unavailable"
+
+
+@pytest.mark.asyncio
+async def test_health_check_reports_failed_query(
+    app: FastAPI, client: AsyncClient
+) -> None:
+    """Test that a failing query on an open connection is reported as unhealthy.
+
+    Args:
+        app: Test FastAPI application.
+        client: Test client.
+    """
+    session = MagicMock(spec=Session)
+    session.execute.side_effect = OperationalError("SELECT 1", {}, Exception("lost"))
+    app.dependency_overrides[get_db] = lambda: session
+
+    response = await client.get("/api/v1/health/")
+    assert response.status_code == 200
+    assert response.json()["dependencies"]["database"]["status"] == "unhealthy"
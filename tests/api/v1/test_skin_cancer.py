@@ -0,0 +1,63 @@
+"""Skin cancer endpoint tests."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from src.app.models.skin_cancer_data import SkinCancerData
+
+
+@pytest.fixture
+def skin_cancer_rows(test_db: Session) -> None:
+    """Insert melanoma records for 2000-2004 plus one other cancer group.
+
+    Args:
+        test_db: Test database session.
+    """
+    test_db.add_all(
+        SkinCancerData(
+            data_type="Actual",
+            cancer_group="Melanoma of the skin",
+            year=year,
+            sex="Persons",
+            age_group="00-04",
+            count=year - 1999,
+        )
+        for year in range(2000, 2005)
+    )
+    test_db.add(
+        SkinCancerData(
+            data_type="Actual",
+            cancer_group="Other",
+            year=2000,
+            sex="Persons",
+            age_group="00-04",
+            count=1,
+        )
+    )
+    test_db.commit()
+
+
+@pytest.mark.asyncio
+async def test_get_skin_cancer_data(client: AsyncClient, skin_cancer_rows) -> None:
+    """Test that a page of data comes back with the total match count.
+
+    Args:
+        client: Test client.
+        skin_cancer_rows: Seeded skin cancer records.
+    """
+    response = await client.get("/api/v1/skin-cancer/", params={"limit": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["data"]) == 2
+    assert data["total"] == 5
+    assert data["data"][0]["age_specific_rate"] is None
+    assert "created_at" not in data["data"][0]
+    assert response.headers["cache-control"] == "public, max-age=300"
+
+    # Pages past the end are empty but still report the total
+    response = await client.get("/api/v1/skin-cancer/", params={"skip": 10})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["data"] == []
+    assert data["total"] == 5
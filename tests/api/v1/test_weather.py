@@ -0,0 +1,294 @@
+"""Weather endpoint tests."""
+
+from datetime import datetime
+
+import httpx
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from src.app.core.http_client import http_client_manager
+from src.app.crud.crud_locations import location_crud
+from src.app.crud.crud_users import user_crud
+from src.app.models.uv_record import UVRecord
+from src.app.services.weather import weather_service
+
+
+@pytest.mark.asyncio
+async def test_get_temperature_map(client: AsyncClient) -> None:
+    """Test temperature map endpoint.
+
+    Args:
+        client: Test client.
+    """
+    response = await client.get(
+        "/api/v1/weather/temperature-map",
+        params={"temp_type": "max", "region": "vc", "period": "jan"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["url"].endswith("%2Fmxt%2Fvc%2Fmxtvcjan.png")
+    assert data["temp_type"] == "Maximum Temperature"
+    assert data["region"] == "Victoria"
+    assert data["period"] == "January"
+
+
+@pytest.mark.asyncio
+async def test_get_uv_index_heatmap_rejects_invalid_period(
+    client: AsyncClient,
+) -> None:
+    """Test that an unknown period is rejected before reaching the handler.
+
+    Args:
+        client: Test client.
+    """
+    response = await client.get(
+        "/api/v1/weather/uv-index-heatmap", params={"period": "winter"}
+    )
+    assert response.status_code == 422
+
+
+async def _fake_get_weather_data(lat: float, lon: float) -> dict:
+    """Return canned weather data for the given coordinates."""
+    return {
+        "location": {
+            "name": "Melbourne VIC, Australia",
+            "address": "Melbourne VIC, Australia",
+            "lat": lat,
+            "lon": lon,
+            "country": "Australia",
+            "city": "Melbourne",
+        },
+        "current": {
+            "temp": 18.5,
+            "feels_like": 17.9,
+            "pressure": 1015,
+            "humidity": 60,
+            "uvi": 4.2,
+            "clouds": 20,
+            "visibility": 10000,
+            "wind_speed": 3.6,
+            "wind_deg": 200,
+            "weather": [
+                {"id": 801, "main": "Clouds", "description": "few", "icon": "02d"}
+            ],
+            "sunrise": 1700000000,
+            "sunset": 1700050000,
+        },
+        "timestamp": "2026-10-15T10:00:00",
+    }
+
+
+@pytest.mark.asyncio
+async def test_read_weather_supports_etag(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that GET weather responses are cacheable and revalidated by ETag.
+
+    Args:
+        client: Test client.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(weather_service, "get_weather_data", _fake_get_weather_data)
+    params = {"lat": -37.81, "lon": 144.96}
+
+    response = await client.get("/api/v1/weather/", params=params)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=600"
+    assert response.json()["location"]["city"] == "Melbourne"
+
+    etag = response.headers["etag"]
+    response = await client.get(
+        "/api/v1/weather/", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "if_none_match",
+    ["W/{etag}", '"other", {etag}', '"other",W/{etag}', "*"],
+)
+async def test_read_weather_matches_weak_and_listed_etags(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch, if_none_match: str
+) -> None:
+    """Test that weak, listed and wildcard If-None-Match values get a 304.
+
+    Args:
+        client: Test client.
+        monkeypatch: Pytest monkeypatch fixture.
+        if_none_match: If-None-Match header template.
+    """
+    monkeypatch.setattr(weather_service, "get_weather_data", _fake_get_weather_data)
+    params = {"lat": -37.81, "lon": 144.96}
+
+    etag = (await client.get("/api/v1/weather/", params=params)).headers["etag"]
+    response = await client.get(
+        "/api/v1/weather/",
+        params=params,
+        headers={"If-None-Match": if_none_match.format(etag=etag)},
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_proxy_image_caches_bom_images(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that BoM images are fetched upstream once and then served cached.
+
+    Args:
+        client: Test client.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    upstream_calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        upstream_calls.append(request.url)
+        return httpx.Response(
+            200, content=b"png-bytes", headers={"content-type": "image/png"}
+        )
+
+    monkeypatch.setattr(
+        http_client_manager,
+        "_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    params = {"url": "https://www.bom.gov.au/climate/maps/test/uv-jan.png"}
+
+    for _ in range(2):
+        response = await client.get("/api/v1/weather/proxy-image", params=params)
+        assert response.status_code == 200
+        assert response.content == b"png-bytes"
+        assert response.headers["content-type"] == "image/png"
+
+    assert len(upstream_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_proxy_image_passes_through_upstream_errors(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an upstream 404 is returned as a 404 rather than a 500.
+
+    Args:
+        client: Test client.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(
+        http_client_manager,
+        "_client",
+        httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404))
+        ),
+    )
+
+    response = await client.get(
+        "/api/v1/weather/proxy-image",
+        params={"url": "https://www.bom.gov.au/climate/maps/test/missing.png"},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_proxy_image_refuses_redirects_to_other_hosts(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a BoM redirect to another host is not followed.
+
+    Args:
+        client: Test client.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    upstream_calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        upstream_calls.append(request.url)
+        return httpx.Response(
+            302, headers={"location": "http://169.254.169.254/latest/meta-data"}
+        )
+
+    monkeypatch.setattr(
+        http_client_manager,
+        "_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    response = await client.get(
+        "/api/v1/weather/proxy-image",
+        params={"url": "https://www.bom.gov.au/climate/maps/test/redirect.png"},
+    )
+    assert response.status_code == 502
+    assert [url.host for url in upstream_calls] == ["www.bom.gov.au"]
+
+
+@pytest.mark.asyncio
+async def test_proxy_image_rejects_other_hosts(client: AsyncClient) -> None:
+    """Test that the image proxy only fetches from BoM hosts.
+
+    Args:
+        client: Test client.
+    """
+    response = await client.get(
+        "/api/v1/weather/proxy-image",
+        params={"url": "http://169.254.169.254/latest/meta-data"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_read_uv_records(client: AsyncClient, test_db: Session) -> None:
+    """Test that UV records are listed with their column values.
+
+    Args:
+        client: Test client.
+        test_db: Test database session.
+    """
+    user = user_crud.get_or_create(test_db, name="Jane Doe")
+    location = location_crud.get_or_create_with_user(
+        test_db, obj_in={"lat": -37.81, "lon": 144.96}, user_id=user.id
+    )
+    test_db.add(UVRecord(uv_index=7.5, clouds=20, location_id=location.id))
+    test_db.commit()
+
+    response = await client.get("/api/v1/weather/uv-records")
+    assert response.status_code == 200
+    (record,) = response.json()
+    assert record["uv_index"] == 7.5
+    assert record["visibility"] is None
+    assert record["location_id"] == location.id
+    assert "created_at" in record
+
+
+@pytest.mark.asyncio
+async def test_read_uv_records_pages_by_cursor(
+    client: AsyncClient, test_db: Session
+) -> None:
+    """Test that records sharing a timestamp are paged by ID after a cursor.
+
+    Args:
+        client: Test client.
+        test_db: Test database session.
+    """
+    user = user_crud.get_or_create(test_db, name="Jane Doe")
+    location = location_crud.get_or_create_with_user(
+        test_db, obj_in={"lat": -37.81, "lon": 144.96}, user_id=user.id
+    )
+    created_at = datetime(2024, 1, 1)
+    test_db.add_all(
+        UVRecord(uv_index=index, location_id=location.id, created_at=created_at)
+        for index in range(3)
+    )
+    test_db.commit()
+
+    response = await client.get("/api/v1/weather/uv-records", params={"limit": 1})
+    (first,) = response.json()
+    response = await client.get(
+        "/api/v1/weather/uv-records",
+        params={"since": first["created_at"], "after_id": first["id"]},
+    )
+    rest = response.json()
+
+    assert len(rest) == 2
+    assert all(record["id"] > first["id"] for record in rest)
@@ -1,13 +1,14 @@
 """Test configuration module."""
 
 import asyncio
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator, Generator, List
 
 import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.app.core.config import settings
 from src.app.core.db.base_class import Base
@@ -37,15 +38,35 @@ def test_engine():
     Yields:
         Test database engine.
     """
+    # Share one connection across threads: sync endpoints run in a threadpool
+    # and each new in-memory SQLite connection would be an empty database
     engine = create_engine(
         TEST_DATABASE_URL,
         echo=False,
         future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
     yield engine
     engine.dispose()
 
 
+def _raise_on_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    """Make relationships that were not eagerly loaded raise on access.
+
+    Catches N+1 query patterns in tests: any relationship a query does not
+    load explicitly (e.g. with ``selectinload``) raises instead of lazily
+    emitting a SELECT per object.
+
+    Args:
+        orm_execute_state: State of the ORM statement being executed.
+    """
+    if orm_execute_state.is_select and not orm_execute_state.is_relationship_load:
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload("*", sql_only=True)
+        )
+
+
 @pytest.fixture(scope="function")
 def test_db(test_engine) -> Generator[Session, None, None]:
     """Create a test database session.
@@ -66,6 +87,7 @@ def test_db(test_engine) -> Generator[Session, None, None]:
         autocommit=False,
         autoflush=False,
     )
+    event.listen(TestSessionLocal, "do_orm_execute", _raise_on_lazy_load)
     session = TestSessionLocal()
     try:
         yield session
@@ -75,6 +97,28 @@ def test_db(test_engine) -> Generator[Session, None, None]:
         Base.metadata.drop_all(bind=test_engine)
 
 
+@pytest.fixture(scope="function")
+def statements(test_engine) -> Generator[List[str], None, None]:
+    """Record the SQL statements executed on the test engine.
+
+    Args:
+        test_engine: Test database engine.
+
+    Yields:
+        List that each executed statement is appended to.
+    """
+    executed: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        executed.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    try:
+        yield executed
+    finally:
+        event.remove(test_engine, "before_cursor_execute", record)
+
+
 @pytest.fixture(scope="function")
 def app(test_db) -> FastAPI:
     """Create a test FastAPI application.
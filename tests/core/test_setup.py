@@ -0,0 +1,24 @@
+"""Application setup tests."""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight_is_cacheable(client: AsyncClient) -> None:
+    """Test that CORS preflight responses tell browsers to cache them.
+
+    Args:
+        client: Test client.
+    """
+    response = await client.options(
+        "/api/v1/weather/",
+        headers={
+            "Origin": "https://uvchecker.net",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "https://uvchecker.net"
+    assert response.headers["access-control-max-age"] == "86400"
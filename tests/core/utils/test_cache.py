@@ -0,0 +1,40 @@
+"""Tests for the in-process cache utilities."""
+
+from src.app.core.utils.cache import TTLCache
+
+
+class FakeTimer:
+    """Manually advanced clock for expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    """Test that entries are dropped once their TTL has passed."""
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=10, ttl=60, timer=timer)
+
+    cache.set("melbourne", [1, 2, 3])
+    assert cache.get("melbourne") == [1, 2, 3]
+
+    timer.now = 60
+    assert cache.get("melbourne") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the least recently used entry is evicted when full."""
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
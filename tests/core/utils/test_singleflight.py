@@ -0,0 +1,26 @@
+"""Tests for the single-flight call deduplication."""
+
+import asyncio
+
+from src.app.core.utils.singleflight import SingleFlight
+
+
+async def test_single_flight_shares_concurrent_calls():
+    """Test that concurrent calls with the same key run the function once."""
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"lat": -37.81, "lng": 144.96}
+
+    flight = SingleFlight()
+    results = await asyncio.gather(*(flight.do("melbourne", fetch) for _ in range(5)))
+
+    assert calls == 1
+    assert all(result == results[0] for result in results)
+
+    # A finished call is not reused
+    await flight.do("melbourne", fetch)
+    assert calls == 2
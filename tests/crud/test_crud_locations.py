@@ -0,0 +1,46 @@
+"""Location CRUD tests."""
+
+from sqlalchemy.orm import Session
+
+from src.app.crud.crud_locations import location_crud
+from src.app.crud.crud_users import user_crud
+from src.app.crud.crud_uv_records import uv_record_crud
+
+
+def test_get_or_create_with_user_reuses_coordinates(test_db: Session) -> None:
+    """Test that a second request for the same coordinates reuses the row."""
+    first_user = user_crud.get_or_create(test_db, name="Jane Doe")
+    second_user = user_crud.get_or_create(test_db, name="John Doe")
+    obj_in = {"lat": -37.81, "lon": 144.96, "city": "Melbourne"}
+
+    created = location_crud.get_or_create_with_user(
+        test_db, obj_in=obj_in, user_id=first_user.id
+    )
+    fetched = location_crud.get_or_create_with_user(
+        test_db, obj_in=obj_in, user_id=second_user.id
+    )
+
+    assert fetched.id == created.id
+    assert fetched.user_id == first_user.id
+    assert fetched.city == "Melbourne"
+
+
+def test_get_by_user_id_loads_records(test_db: Session) -> None:
+    """Test that a user's locations can be fetched with their records."""
+    user = user_crud.get_or_create(test_db, name="Jane Doe")
+    for lat in (-37.81, -37.82):
+        location = location_crud.get_or_create_with_user(
+            test_db, obj_in={"lat": lat, "lon": 144.96}, user_id=user.id
+        )
+        uv_record_crud.create_from_weather_data(
+            test_db, weather_data={"current": {"uvi": 3.0}}, location_id=location.id
+        )
+    test_db.expunge_all()
+
+    locations = location_crud.get_by_user_id(
+        test_db, user_id=user.id, with_records=True
+    )
+
+    assert len(locations) == 2
+    assert all(len(location.uv_records) == 1 for location in locations)
+    assert all(location.temperature_records == [] for location in locations)
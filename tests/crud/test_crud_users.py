@@ -0,0 +1,88 @@
+"""User CRUD tests."""
+
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from src.app.crud.crud_locations import location_crud
+from src.app.crud.crud_users import user_crud
+from src.app.crud.crud_uv_records import uv_record_crud
+
+
+def test_get_or_create_returns_existing_user(test_db: Session) -> None:
+    """Test that repeated calls for one name return the same user."""
+    created = user_crud.get_or_create(test_db, name="Jane Doe")
+    fetched = user_crud.get_or_create(test_db, name="Jane Doe")
+
+    assert fetched.id == created.id
+    assert fetched.username == "jane_doe"
+
+
+def test_get_or_create_deduplicates_username(test_db: Session) -> None:
+    """Test that names mapping to a taken username get a numbered suffix."""
+    user_crud.get_or_create(test_db, name="Jane Doe")
+    user = user_crud.get_or_create(test_db, name="jane doe")
+
+    assert user.username == "jane_doe_1"
+
+
+def test_get_or_create_keeps_pending_work_on_username_conflict(
+    test_db: Session,
+) -> None:
+    """Test that a username conflict does not discard uncommitted changes."""
+    user_crud.get_or_create(test_db, name="Jane Doe")
+    pending = user_crud.get_or_create(test_db, name="John Smith", commit=False)
+
+    user = user_crud.get_or_create(test_db, name="jane doe", commit=False)
+    test_db.commit()
+
+    assert user.username == "jane_doe_1"
+    assert user_crud.get_by_name(test_db, name="John Smith").id == pending.id
+
+
+def test_update_refreshes_record(test_db: Session) -> None:
+    """Test that update writes the given columns and ignores other keys."""
+    user = user_crud.get_or_create(test_db, name="Jane Doe")
+    updated = user_crud.update(
+        test_db, db_obj=user, obj_in={"username": "jane", "not_a_column": 1}
+    )
+
+    assert updated is user
+    assert updated.username == "jane"
+    assert user_crud.get(test_db, user.id).username == "jane"
+
+
+def test_get_or_create_ignores_stale_cached_user(test_db: Session) -> None:
+    """Test that a removed user's cached ID does not hide the missing row."""
+    removed = user_crud.get_or_create(test_db, name="Jane Doe")
+    user_crud.remove(test_db, id=removed.id)
+    # Simulate another process removing the user after it was cached
+    user_crud._id_by_name.set("Jane Doe", removed.id)
+
+    user = user_crud.get_or_create(test_db, name="Jane Doe")
+
+    assert user.id != removed.id
+    assert user_crud.get_or_create(test_db, name="Jane Doe").id == user.id
+
+
+def test_remove_loads_dependents_in_bounded_queries(
+    test_db: Session, statements: List[str]
+) -> None:
+    """Test that removing a user does not load its dependents row by row."""
+    user = user_crud.get_or_create(test_db, name="Jane Doe")
+    for lat in (-37.81, -37.82, -37.83):
+        location = location_crud.get_or_create_with_user(
+            test_db, obj_in={"lat": lat, "lon": 144.96}, user_id=user.id
+        )
+        uv_record_crud.create_from_weather_data(
+            test_db, weather_data={"current": {"uvi": 3.0}}, location_id=location.id
+        )
+    test_db.expunge_all()
+    statements.clear()
+
+    user_crud.remove(test_db, id=user.id)
+
+    selects = [statement for statement in statements if statement.startswith("SELECT")]
+    # The user, then one query each for locations, UV and temperature records
+    assert len(selects) == 4
+    assert user_crud.get(test_db, user.id) is None
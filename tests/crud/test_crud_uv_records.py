@@ -0,0 +1,49 @@
+"""UV record CRUD tests."""
+
+from sqlalchemy.orm import Session
+
+from src.app.crud.crud_locations import location_crud
+from src.app.crud.crud_users import user_crud
+from src.app.crud.crud_uv_records import uv_record_crud
+
+
+def test_bulk_create_from_weather_data(test_db: Session) -> None:
+    """Test that bulk creation writes one record per location."""
+    user = user_crud.get_or_create(test_db, name="Jane Doe")
+    locations = [
+        location_crud.get_or_create_with_user(
+            test_db, obj_in={"lat": lat, "lon": 144.96}, user_id=user.id
+        )
+        for lat in (-37.81, -37.82)
+    ]
+
+    uv_record_crud.bulk_create_from_weather_data(
+        test_db,
+        items=[
+            ({"current": {"uvi": 3.0 + index, "clouds": 40}}, location.id)
+            for index, location in enumerate(locations)
+        ],
+    )
+
+    records = uv_record_crud.get_uv_records(test_db)
+    assert sorted(record.uv_index for record in records) == [3.0, 4.0]
+    assert {record.location_id for record in records} == {
+        location.id for location in locations
+    }
+    assert all(record.id and record.created_at for record in records)
+
+
+def test_stream_rows_yields_all_records_in_batches(test_db: Session) -> None:
+    """Test that streaming returns every record across batch boundaries."""
+    user = user_crud.get_or_create(test_db, name="Jane Doe")
+    location = location_crud.get_or_create_with_user(
+        test_db, obj_in={"lat": -37.81, "lon": 144.96}, user_id=user.id
+    )
+    uv_record_crud.bulk_create_from_weather_data(
+        test_db,
+        items=[({"current": {"uvi": float(index)}}, location.id) for index in range(5)],
+    )
+
+    rows = list(uv_record_crud.stream_rows(test_db, batch_size=2))
+
+    assert sorted(row.uv_index for row in rows) == [0.0, 1.0, 2.0, 3.0, 4.0]
@@ -1,6 +1,7 @@
 """Tests for the skin cancer data import script."""
 
-import os
+import csv
+import io
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -11,8 +12,11 @@ from sqlalchemy.orm import Session
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from scripts.python.import_skin_cancer_data import import_skin_cancer_data
-from src.app.models.skin_cancer_data import SkinCancerData
+from scripts.python.import_skin_cancer_data import (
+    COPY_COLUMNS,
+    import_skin_cancer_data,
+    iter_records,
+)
 
 
 @pytest.fixture
@@ -26,7 +30,7 @@ def mock_session():
 def mock_db_manager(mock_session):
     """Create a mock database manager."""
     with patch(
-        "scripts.import_skin_cancer_data.DatabaseSessionManager"
+        "scripts.python.import_skin_cancer_data.DatabaseSessionManager"
     ) as mock_db_manager_class:
         db_manager = mock_db_manager_class.return_value
         db_manager.initialize.return_value = True
@@ -35,43 +39,39 @@ def mock_db_manager(mock_session):
 
 
 @pytest.fixture
-def mock_csv_file():
+def mock_csv_file(tmp_path):
     """Create a mock CSV file."""
     csv_content = """Data type,Cancer group/site,Year,Sex,Age group (years),Count
 Actual,Melanoma of the skin,2020,Males,'00-04,0
 Actual,Melanoma of the skin,2020,Males,'05-09,1
 Actual,Melanoma of the skin,2020,Females,'00-04,2
 """
-    csv_path = (
-        Path(__file__).resolve().parent.parent.parent
-        / "src"
-        / "app"
-        / "data"
-        / "skin_cancer_data.csv"
-    )
+    csv_path = tmp_path / "skin_cancer_data.csv"
+    csv_path.write_text(csv_content)
 
-    # Ensure the directory exists
-    os.makedirs(csv_path.parent, exist_ok=True)
+    # Point the script at the temporary file instead of the bundled dataset
+    with patch("scripts.python.import_skin_cancer_data.CSV_PATH", csv_path):
+        yield csv_path
 
-    # Create a temporary CSV file for testing
-    with open(csv_path, "w") as f:
-        f.write(csv_content)
 
-    yield csv_path
-
-    # Clean up - remove the file after the test
-    if csv_path.exists():
-        os.remove(csv_path)
-
-
-@patch("scripts.import_skin_cancer_data.logger")
+@patch("scripts.python.import_skin_cancer_data.logger")
 def test_import_skin_cancer_data(
     mock_logger, mock_db_manager, mock_session, mock_csv_file
 ):
     """Test the import_skin_cancer_data function."""
-    # Set up mock query and delete
-    mock_query = mock_session.query.return_value
-    mock_query.delete.return_value = None
+    # Capture the CSV payload streamed through COPY, reading in small chunks
+    copied = {}
+
+    def copy_expert(sql, stream):
+        chunks = []
+        while chunk := stream.read(16):
+            chunks.append(chunk)
+        copied["sql"] = sql
+        copied["rows"] = list(csv.reader(io.StringIO("".join(chunks))))
+
+    connection = mock_session.connection.return_value
+    cursor = connection.connection.cursor.return_value.__enter__.return_value
+    cursor.copy_expert.side_effect = copy_expert
 
     # Call the function
     import_skin_cancer_data()
@@ -79,29 +79,50 @@ def test_import_skin_cancer_data(
     # Verify the database was initialized
     mock_db_manager.initialize.assert_called_once()
 
-    # Verify existing data was deleted
-    mock_session.query.assert_called_with(SkinCancerData)
-    mock_query.delete.assert_called_once()
-
-    # Verify new data was added
-    assert mock_session.add_all.call_count == 1
+    # Verify new data was loaded into the staging table with a single COPY
+    cursor.copy_expert.assert_called_once()
+    assert copied["sql"].startswith("COPY skin_cancer_data_new (")
 
-    # Get the batch of records that was added
-    added_records = mock_session.add_all.call_args[0][0]
+    # Verify the staging table was swapped in for the live one
+    statements = [str(c.args[0]) for c in mock_session.execute.call_args_list]
+    assert "CREATE TABLE skin_cancer_data_new" in statements[1]
+    assert "DROP TABLE skin_cancer_data" in statements
+    assert "ALTER TABLE skin_cancer_data_new RENAME TO skin_cancer_data" in statements
 
-    # Verify the correct number of records was added
+    # Verify the correct number of records was copied
+    added_records = copied["rows"]
     assert len(added_records) == 3
 
     # Verify the records have the correct data
-    assert added_records[0].data_type == "Actual"
-    assert added_records[0].cancer_group == "Melanoma of the skin"
-    assert added_records[0].year == 2020
-    assert added_records[0].sex == "Males"
-    assert added_records[0].age_group == "'00-04"
-    assert added_records[0].count == 0
-
-    # Verify commit was called
-    assert mock_session.commit.call_count >= 2  # Once for delete, at least once for add
+    record = dict(zip(COPY_COLUMNS, added_records[0]))
+    assert record["data_type"] == "Actual"
+    assert record["cancer_group"] == "Melanoma of the skin"
+    assert record["year"] == "2020"
+    assert record["sex"] == "Males"
+    assert record["age_group"] == "00-04"
+    assert record["count"] == "0"
+    assert record["id"]
+    assert record["created_at"] == record["updated_at"]
+
+    # Verify the delete and reload ran in a single transaction
+    mock_session.begin.assert_called_once()
+    mock_session.commit.assert_not_called()
 
     # Verify success message was logged
     mock_logger.info.assert_any_call("Successfully imported 3 records")
+
+
+def test_iter_records_skips_non_digit_counts():
+    """Test that only plain non-negative integer counts are imported."""
+    header = ["Data type", "Cancer group/site", "Year", "Sex", "Age group (years)"]
+    rows = [
+        header + ["Count"],
+        *(
+            ["Actual", "Melanoma of the skin", "2020", "Males", "'00-04", count]
+            for count in ("12", "np", "-5", " 12", "1_000")
+        ),
+    ]
+
+    records = list(iter_records(iter(rows)))
+
+    assert records == [("Actual", "Melanoma of the skin", 2020, "Males", "00-04", 12)]